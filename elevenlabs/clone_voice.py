@@ -1,22 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import json as _json
 import logging
+import tempfile
 from io import BytesIO
-from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import httpx
+from elevenlabs_common import get_api_key, invalidate_api_key
 from griptape.artifacts.audio_artifact import AudioArtifact
 from griptape.artifacts.audio_url_artifact import AudioUrlArtifact
 from griptape_nodes.exe_types.core_types import Parameter, ParameterList, ParameterMessage, ParameterMode
 from griptape_nodes.exe_types.node_types import DataNode
 from griptape_nodes.exe_types.param_types.parameter_bool import ParameterBool
-from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 from griptape_nodes.traits.multi_options import MultiOptions
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent connections (sample downloads plus the upload) when cloning
+MAX_CONNECTIONS = 10
+# HTTP/2 is only negotiated when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Downloaded samples stay in a BytesIO up to this size; larger ones are moved to a real temp file. (A
+# SpooledTemporaryFile would not help: httpx calls fileno() to size each part, which forces it to disk.)
+SAMPLE_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class ElevenLabsCloneVoice(DataNode):
     """Clone a voice from audio samples using ElevenLabs Instant Voice Cloning API.
@@ -37,6 +48,20 @@ class ElevenLabsCloneVoice(DataNode):
     API_KEY_NAME: str = "ELEVEN_LABS_API_KEY"
     _logger = logging.getLogger("griptape_nodes")
 
+    ERROR_PARSE_MAX_LENGTH = 8192
+
+    # Static UI content, shared by all instances instead of rebuilt in every __init__
+    LABEL_CHOICES: tuple[str, ...] = ("narrator", "male", "female", "deep", "accented", "neutral")
+    AUDIO_REQUIREMENTS_TEXT: str = (
+        "**Audio Sample Requirements:**\n\n"
+        "• **Duration:** 1-2 minutes of clear audio (recommended for Instant Voice Cloning)\n\n"
+        "• **Quality:** Clear, noise-free recordings with consistent volume and tone\n\n"
+        "• **Content:** Single speaker, no background noise, minimal reverb\n\n"
+        "• **Multiple files:** Providing multiple audio samples improves clone quality\n\n"
+        "• **Format:** MP3, 192kbps+\n\n"
+        "For best results, use professional recording equipment in a quiet environment."
+    )
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
@@ -47,15 +72,7 @@ class ElevenLabsCloneVoice(DataNode):
         self.audio_requirements_message = ParameterMessage(
             name="audio_requirements",
             variant="info",
-            value=(
-                "**Audio Sample Requirements:**\n\n"
-                "• **Duration:** 1-2 minutes of clear audio (recommended for Instant Voice Cloning)\n\n"
-                "• **Quality:** Clear, noise-free recordings with consistent volume and tone\n\n"
-                "• **Content:** Single speaker, no background noise, minimal reverb\n\n"
-                "• **Multiple files:** Providing multiple audio samples improves clone quality\n\n"
-                "• **Format:** MP3, 192kbps+\n\n"
-                "For best results, use professional recording equipment in a quiet environment."
-            ),
+            value=self.AUDIO_REQUIREMENTS_TEXT,
             full_width=True,
             markdown=True,
             hide=False,
@@ -133,14 +150,8 @@ class ElevenLabsCloneVoice(DataNode):
                 type="list",
                 traits={
                     MultiOptions(
-                        choices=[
-                            "narrator",
-                            "male",
-                            "female",
-                            "deep",
-                            "accented",
-                            "neutral",
-                        ],
+                        # Copied per instance since user-created options extend the list
+                        choices=list(self.LABEL_CHOICES),
                         allow_user_created_options=True,
                     )
                 },
@@ -173,6 +184,9 @@ class ElevenLabsCloneVoice(DataNode):
         yield lambda: self._run()
 
     def _run(self) -> None:
+        asyncio.run(self._run_async())
+
+    async def _run_async(self) -> None:
         audio_input = self.get_parameter_value("audio")
         voice_name: str = self.get_parameter_value("voice_name") or "Cloned Voice"
         remove_background_noise: bool = bool(self.get_parameter_value("remove_background_noise"))
@@ -184,7 +198,7 @@ class ElevenLabsCloneVoice(DataNode):
             raise ValueError(error_msg)
 
         # Get API key
-        api_key = GriptapeNodes.SecretsManager().get_secret(self.API_KEY_NAME)
+        api_key = get_api_key(self.API_KEY_NAME)
         if not api_key:
             error_msg = f"{self.name} is missing {self.API_KEY_NAME}. Ensure it's set in the environment/config."
             raise RuntimeError(error_msg)
@@ -203,42 +217,43 @@ class ElevenLabsCloneVoice(DataNode):
 
         # Prepare files for multipart upload
         files = []
-        temp_files = []
 
         try:
-            for audio in audio_list:
-                file_obj = self._prepare_audio_file(audio)
-                if file_obj:
-                    # Use tuple format: (field_name, (filename, file_obj, content_type))
-                    files.append(("files", ("audio.mp3", file_obj, "audio/mpeg")))
-                    # Track temp files for cleanup
-                    if hasattr(file_obj, "name") and Path(file_obj.name).exists():
-                        temp_files.append(Path(file_obj.name))
-
-            if not files:
-                error_msg = f"{self.name}: Failed to prepare audio files for upload."
-                raise ValueError(error_msg)
-
-            # Make API request - use correct endpoint from API docs
-            base_url = "https://api.elevenlabs.io"
-            url = f"{base_url}/v1/voices/add"
-            headers = {"xi-api-key": api_key}
-
-            # Prepare multipart form data
-            data: dict[str, Any] = {"name": voice_name}
-            if remove_background_noise:
-                data["remove_background_noise"] = "true"
-            if description:
-                data["description"] = description
-            if labels:
-                # Serialize labels as JSON string (API expects serialized dictionary)
-                # labels can be a list (from MultiOptions) or a string
-                labels_json = self._serialize_labels(labels)
-                if labels_json:
-                    data["labels"] = labels_json
-
-            with httpx.Client(timeout=300.0) as client:
-                response = client.post(url, data=data, files=files, headers=headers)
+            # One pooled client serves the sample downloads and the upload, so connections are reused
+            async with httpx.AsyncClient(
+                timeout=300.0,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+            ) as client:
+                for file_obj in await self._prepare_audio_files(audio_list, client):
+                    if file_obj:
+                        # Use tuple format: (field_name, (filename, file_obj, content_type))
+                        files.append(("files", ("audio.mp3", file_obj, "audio/mpeg")))
+
+                if not files:
+                    error_msg = f"{self.name}: Failed to prepare audio files for upload."
+                    raise ValueError(error_msg)
+
+                # Make API request - use correct endpoint from API docs
+                base_url = "https://api.elevenlabs.io"
+                url = f"{base_url}/v1/voices/add"
+                headers = {"xi-api-key": api_key}
+
+                # Prepare multipart form data
+                data: dict[str, Any] = {"name": voice_name}
+                if remove_background_noise:
+                    data["remove_background_noise"] = "true"
+                if description:
+                    data["description"] = description
+                if labels:
+                    # Serialize labels as JSON string (API expects serialized dictionary)
+                    # labels can be a list (from MultiOptions) or a string
+                    labels_json = self._serialize_labels(labels)
+                    if labels_json:
+                        data["labels"] = labels_json
+
+                # Parts are streamed from the prepared samples; httpx sizes each seekable part for Content-Length
+                response = await client.post(url, data=data, files=files, headers=headers)
                 response.raise_for_status()
                 response_data = response.json()
 
@@ -257,6 +272,8 @@ class ElevenLabsCloneVoice(DataNode):
                 self.parameter_output_values["requires_verification"] = requires_verification
 
         except httpx.HTTPStatusError as e:
+            if e.response.status_code in (401, 403):
+                invalidate_api_key(self.API_KEY_NAME)
             self._logger.error(f"CloneVoice HTTP error: {e.response.status_code} - {e.response.text}")
             error_message = self._parse_error_response(e.response.text, e.response.status_code)
             raise RuntimeError(error_message) from e
@@ -265,13 +282,13 @@ class ElevenLabsCloneVoice(DataNode):
             error_msg = f"Failed to create voice clone: {e}"
             raise RuntimeError(error_msg) from e
         finally:
-            # Clean up temp files
-            for temp_file in temp_files:
+            # Close prepared samples; spilled downloads are anonymous temp files removed on close,
+            # so there are no named temp paths to clean up
+            for _, (_, file_obj, _) in files:
                 try:
-                    if temp_file.exists():
-                        temp_file.unlink()
+                    file_obj.close()
                 except Exception as e:
-                    self._logger.warning(f"Failed to cleanup temp file {temp_file}: {e}")
+                    self._logger.warning(f"Failed to close audio sample: {e}")
 
     def _normalize_audio_input(self, audio_input: Any) -> list[AudioUrlArtifact | AudioArtifact]:
         """Normalize audio input to a list of audio artifacts.
@@ -310,8 +327,23 @@ class ElevenLabsCloneVoice(DataNode):
 
         return None
 
-    def _prepare_audio_file(self, audio: AudioUrlArtifact | AudioArtifact) -> BytesIO | None:
-        """Prepare audio file for multipart upload. Returns BytesIO or file-like object."""
+    async def _prepare_audio_files(
+        self, audio_list: list[AudioUrlArtifact | AudioArtifact], client: httpx.AsyncClient
+    ) -> list[IO[bytes] | None]:
+        """Prepare all audio files for upload, downloading URL samples concurrently.
+
+        Results are returned in the same order as audio_list.
+        """
+        return await asyncio.gather(*(self._prepare_audio_file(audio, client) for audio in audio_list))
+
+    async def _prepare_audio_file(
+        self, audio: AudioUrlArtifact | AudioArtifact, client: httpx.AsyncClient
+    ) -> IO[bytes] | None:
+        """Prepare audio file for multipart upload. Returns BytesIO or file-like object.
+
+        URL samples are downloaded into memory and moved to a temp file once they pass SAMPLE_SPOOL_MAX_SIZE,
+        so large downloads are not held in memory; httpx reads either lazily during the multipart upload.
+        """
         if isinstance(audio, AudioArtifact):
             # Direct bytes from AudioArtifact
             return BytesIO(audio.value)
@@ -322,13 +354,20 @@ class ElevenLabsCloneVoice(DataNode):
             if not audio_url:
                 return None
 
+            sample: IO[bytes] = BytesIO()
             try:
-                # Download audio bytes
-                with httpx.Client(timeout=300.0) as client:
-                    response = client.get(audio_url)
+                async with client.stream("GET", audio_url) as response:
                     response.raise_for_status()
-                    return BytesIO(response.content)
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        if isinstance(sample, BytesIO) and sample.tell() + len(chunk) > SAMPLE_SPOOL_MAX_SIZE:
+                            spilled = tempfile.TemporaryFile()
+                            spilled.write(sample.getbuffer())
+                            sample = spilled
+                        sample.write(chunk)
+                sample.seek(0)
+                return sample
             except Exception as e:
+                sample.close()
                 self._logger.error(f"Failed to download audio from {audio_url}: {e}")
                 return None
 
@@ -347,12 +386,11 @@ class ElevenLabsCloneVoice(DataNode):
 
         # Handle list input (from MultiOptions)
         if isinstance(labels, list):
-            items = [str(item).strip() for item in labels if item and str(item).strip()]
+            items = [item for item in (str(label).strip() for label in labels if label) if item]
             if not items:
                 return None
-            # Convert to dict format - use numeric keys
-            labels_dict = {str(i): item for i, item in enumerate(items)}
-            return _json.dumps(labels_dict)
+            # Convert to dict format - json.dumps renders the integer keys as numeric strings
+            return _json.dumps(dict(enumerate(items)))
 
         # Handle string input
         if not isinstance(labels, str):
@@ -362,52 +400,59 @@ class ElevenLabsCloneVoice(DataNode):
         if not labels_str:
             return None
 
-        # Try to parse as JSON first
-        try:
-            parsed = _json.loads(labels_str)
-            # If it's already a dict, serialize it
-            if isinstance(parsed, dict):
-                return _json.dumps(parsed)
-            # If it's a list, convert to dict with numeric keys
-            if isinstance(parsed, list):
-                return _json.dumps({str(i): item for i, item in enumerate(parsed)})
-        except (_json.JSONDecodeError, TypeError):
-            # Not valid JSON, treat as comma-separated string
-            pass
+        # Only strings that look like JSON containers are worth parsing
+        if labels_str[0] in "{[":
+            try:
+                parsed = _json.loads(labels_str)
+                # A flat string-to-string object is already in the expected shape; forward it as-is
+                if isinstance(parsed, dict):
+                    if all(isinstance(value, str) for value in parsed.values()):
+                        return labels_str
+                    return _json.dumps(parsed)
+                # If it's a list, convert to dict with numeric keys
+                if isinstance(parsed, list):
+                    return _json.dumps(dict(enumerate(parsed)))
+            except (_json.JSONDecodeError, TypeError):
+                # Not valid JSON, treat as comma-separated string
+                pass
 
         # Treat as comma-separated values
-        # Split by comma and create a dict with cleaned values
-        items = [item.strip() for item in labels_str.split(",") if item.strip()]
+        items = [item for item in (part.strip() for part in labels_str.split(",")) if item]
         if not items:
             return None
 
         # Convert to dict format - use numeric keys
-        labels_dict = {str(i): item for i, item in enumerate(items)}
-        return _json.dumps(labels_dict)
+        return _json.dumps(dict(enumerate(items)))
 
     def _parse_error_response(self, response_text: str, status_code: int) -> str:
         """Parse error response and extract meaningful error information."""
-        try:
-            error_data = _json.loads(response_text)
-
-            if "detail" in error_data:
-                detail = error_data["detail"]
-                if isinstance(detail, dict):
-                    status = detail.get("status", "")
-                    message = detail.get("message", "")
-                    if status and message:
-                        return f"{status}: {message}"
-                    if message:
-                        return f"Error: {message}"
-                elif isinstance(detail, str):
-                    return f"Error: {detail}"
-
-            if "error" in error_data:
-                error_msg = error_data["error"]
-                if isinstance(error_msg, str):
-                    return f"Error: {error_msg}"
-
+        # Oversized bodies (e.g. proxy HTML pages) aren't API error JSON; don't bother parsing them
+        if len(response_text) > self.ERROR_PARSE_MAX_LENGTH:
             return f"API Error ({status_code}): {response_text[:200]}"
 
-        except Exception:
+        try:
+            error_data = _json.loads(response_text)
+        except (_json.JSONDecodeError, TypeError):
             return f"API Error ({status_code}): Unable to parse error response"
+
+        if isinstance(error_data, dict):
+            for key in ("detail", "error", "message"):
+                formatted = self._format_error_value(error_data.get(key))
+                if formatted:
+                    return formatted
+
+        return f"API Error ({status_code}): {response_text[:200]}"
+
+    def _format_error_value(self, value: Any) -> str | None:
+        """Format a detail/error/message field from an API error body."""
+        if isinstance(value, dict):
+            status = value.get("status", "")
+            message = value.get("message", "")
+            if status and message:
+                return f"{status}: {message}"
+            if message:
+                return f"Error: {message}"
+            return None
+        if isinstance(value, str) and value:
+            return f"Error: {value}"
+        return None
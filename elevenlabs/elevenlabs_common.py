@@ -0,0 +1,120 @@
+"""Helpers shared by the ElevenLabs nodes.
+
+The engine puts the library directory on sys.path, so node modules import this as a top-level module.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json as _json
+import os
+import threading
+import time
+from typing import Any
+
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when it isn't installed
+    orjson = None
+
+
+# Resolved API keys, keyed by secret name. SecretsManager re-reads .env files on every lookup,
+# so keys are resolved once per process and only dropped again when the API rejects them.
+_api_key_cache: dict[str, str] = {}
+
+
+def get_api_key(name: str) -> str | None:
+    api_key = _api_key_cache.get(name)
+    if not api_key:
+        api_key = GriptapeNodes.SecretsManager().get_secret(name)
+        if api_key:
+            _api_key_cache[name] = api_key
+    return api_key
+
+
+def invalidate_api_key(name: str) -> None:
+    _api_key_cache.pop(name, None)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    """Serialize a compact JSON string for form fields, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return _json.dumps(obj, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return _json.loads(data)
+
+
+class TokenBucket:
+    """Per-minute request and token budget shared by every node in the process.
+
+    Callers reserve capacity up front, letting the balance go negative, so concurrent callers queue behind
+    each other instead of all waking at the same refill. A limit of 0 disables that budget.
+    """
+
+    def __init__(self, rpm: float, tpm: float) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self.request_tokens = rpm
+        self.token_tokens = tpm
+        self.last_update = time.monotonic()
+        # Nodes call in from different threads and event loops, so the bookkeeping is guarded by a thread lock
+        self._lock = threading.Lock()
+
+    def reserve(self, estimated_tokens: float = 0.0) -> float:
+        """Take one request and estimated_tokens from the budget; return how long to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_update
+            self.last_update = now
+            wait_time = 0.0
+            if self.rpm > 0:
+                self.request_tokens = min(self.rpm, self.request_tokens + elapsed * self.rpm / 60)
+                if self.request_tokens < 1:
+                    wait_time = (1 - self.request_tokens) * 60 / self.rpm
+                self.request_tokens -= 1
+            if self.tpm > 0 and estimated_tokens > 0:
+                estimated_tokens = min(estimated_tokens, self.tpm)
+                self.token_tokens = min(self.tpm, self.token_tokens + elapsed * self.tpm / 60)
+                if self.token_tokens < estimated_tokens:
+                    wait_time = max(wait_time, (estimated_tokens - self.token_tokens) * 60 / self.tpm)
+                self.token_tokens -= estimated_tokens
+            return wait_time
+
+    async def acquire(self, estimated_tokens: float = 0.0) -> None:
+        wait_time = self.reserve(estimated_tokens)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def acquire_blocking(self, estimated_tokens: float = 0.0) -> None:
+        """Like acquire, for synchronous callers running on a worker thread."""
+        wait_time = self.reserve(estimated_tokens)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def _env_rate_limit(name: str) -> float:
+    try:
+        return max(float(os.environ.get(name) or 0), 0.0)
+    except ValueError:
+        return 0.0
+
+
+# One budget for every rate-limited ElevenLabs call in the process: ELEVEN_RPM requests and ELEVEN_TPM
+# characters per minute, so a fan-out of nodes queues locally instead of bouncing off 429s.
+# Unset or 0 means unlimited.
+request_bucket = TokenBucket(_env_rate_limit("ELEVEN_RPM"), _env_rate_limit("ELEVEN_TPM"))
@@ -1,21 +1,116 @@
 from __future__ import annotations
 
+import asyncio
 import base64
-import json as _json
+import importlib.util
 import logging
+import os
+import random
+import re
+import weakref
 from typing import Any
 
 import httpx
+from elevenlabs_common import dumps, get_api_key, invalidate_api_key, loads
 from griptape.artifacts.audio_url_artifact import AudioUrlArtifact
 from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
 from griptape_nodes.exe_types.node_types import DataNode
 from griptape_nodes.exe_types.param_components.project_file_parameter import ProjectFileParameter
 from griptape_nodes.exe_types.param_types.parameter_bool import ParameterBool
 from griptape_nodes.exe_types.param_types.parameter_float import ParameterFloat
-from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 from griptape_nodes.traits.options import Options
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Async clients are bound to the event loop they first connect on, so keep one per loop; concurrent
+# generations on the same loop share its pooled TLS connections to the API. HTTP/2 is only negotiated
+# when the optional h2 package is installed. Pool sizes can be lowered through the environment to
+# apply backpressure.
+_http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=_env_int("ELEVENLABS_HTTPX_MAX_CONNECTIONS", 100),
+    max_keepalive_connections=_env_int("ELEVENLABS_HTTPX_MAX_KEEPALIVE", 20),
+)
+
+
+# Upper bound on in-flight generation requests per loop, so parallel music nodes don't storm the API
+# into 429s. Kept per loop for the same reason as the clients.
+_MAX_INFLIGHT = max(1, _env_int("ELEVENLABS_MAX_INFLIGHT", 8))
+_inflight_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_inflight_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _inflight_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_MAX_INFLIGHT)
+        _inflight_semaphores[loop] = semaphore
+    return semaphore
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(300.0, connect=10.0), http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS
+        )
+        _http_clients[loop] = client
+    return client
+
+
+OUTPUT_FORMATS: tuple[str, ...] = (
+    "mp3_22050_32",
+    "mp3_24000_48",
+    "mp3_44100_32",
+    "mp3_44100_64",
+    "mp3_44100_96",
+    "mp3_44100_128",
+    "mp3_44100_192",
+    "pcm_8000",
+    "pcm_16000",
+    "pcm_22050",
+    "pcm_24000",
+    "pcm_32000",
+    "pcm_44100",
+    "pcm_48000",
+    "ulaw_8000",
+    "alaw_8000",
+    "opus_48000_32",
+    "opus_48000_64",
+    "opus_48000_96",
+    "opus_48000_128",
+    "opus_48000_192",
+)
+
+# Codec prefix -> (file extension, mime type)
+_CODEC_META: dict[str, tuple[str, str]] = {
+    "mp3": ("mp3", "audio/mpeg"),
+    "pcm": ("wav", "audio/wav"),
+    "ulaw": ("wav", "audio/wav"),
+    "alaw": ("wav", "audio/wav"),
+    "opus": ("opus", "audio/ogg"),
+}
+_DEFAULT_FORMAT_META = _CODEC_META["mp3"]
+_FORMAT_META: dict[str, tuple[str, str]] = {fmt: _CODEC_META[fmt.split("_", 1)[0]] for fmt in OUTPUT_FORMATS}
+
+_MUSIC_TERMS_RE = re.compile(r"music-terms|limited_access", re.IGNORECASE)
+_MUSIC_TERMS_HELP = (
+    "\n\nTo use Eleven Music, you need to accept the additional terms at "
+    "https://elevenlabs.io/music-terms. Please visit the link to accept "
+    "the terms, then try again."
+)
+
+
 class ElevenLabsGenerateMusic(DataNode):
     """Generate music from a prompt using ElevenLabs Music API and return a playable URL.
 
@@ -37,6 +132,13 @@ class ElevenLabsGenerateMusic(DataNode):
     PROMPT_MAX_LENGTH = 2000
     MIN_MUSIC_LENGTH_SEC = 10.0
     MAX_MUSIC_LENGTH_SEC = 300.0
+    DATA_URL_MAX_BYTES = 1024 * 1024
+    SAVE_ATTEMPTS = 2
+
+    MAX_ATTEMPTS = 5
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 30.0
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
@@ -98,33 +200,7 @@ class ElevenLabsGenerateMusic(DataNode):
                 default_value="mp3_44100_128",
                 tooltip="Audio output format",
                 allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
-                traits={
-                    Options(
-                        choices=[
-                            "mp3_22050_32",
-                            "mp3_24000_48",
-                            "mp3_44100_32",
-                            "mp3_44100_64",
-                            "mp3_44100_96",
-                            "mp3_44100_128",
-                            "mp3_44100_192",
-                            "pcm_8000",
-                            "pcm_16000",
-                            "pcm_22050",
-                            "pcm_24000",
-                            "pcm_32000",
-                            "pcm_44100",
-                            "pcm_48000",
-                            "ulaw_8000",
-                            "alaw_8000",
-                            "opus_48000_32",
-                            "opus_48000_64",
-                            "opus_48000_96",
-                            "opus_48000_128",
-                            "opus_48000_192",
-                        ]
-                    )
-                },
+                traits={Options(choices=list(OUTPUT_FORMATS))},
                 ui_options={"display_name": "Output Format"},
             )
         )
@@ -155,10 +231,13 @@ class ElevenLabsGenerateMusic(DataNode):
             )
         )
 
-    def process(self) -> Any:
-        yield lambda: self._run()
+    def process(self) -> None:
+        pass
+
+    async def aprocess(self) -> None:
+        await self._process_async()
 
-    def _run(self) -> None:
+    async def _process_async(self) -> None:
         prompt: str | None = self.get_parameter_value("prompt")
         use_length: bool = bool(self.get_parameter_value("use_specific_length"))
         duration_seconds: float | None = self.get_parameter_value("music_duration_seconds")
@@ -166,11 +245,13 @@ class ElevenLabsGenerateMusic(DataNode):
         output_format: str = self.get_parameter_value("output_format") or "mp3_44100_128"
         model_id: str = self.get_parameter_value("model_id") or "music_v1"
 
-        if prompt and len(prompt) > self.PROMPT_MAX_LENGTH:
+        prompt_len = len(prompt) if prompt else 0
+        if prompt_len > self.PROMPT_MAX_LENGTH:
             prompt = prompt[: self.PROMPT_MAX_LENGTH]
+            prompt_len = self.PROMPT_MAX_LENGTH
 
-        # Get API key using SecretsManager (same as working voice_changer node)
-        api_key = GriptapeNodes.SecretsManager().get_secret(self.API_KEY_NAME)
+        # Get API key using SecretsManager (cached after the first successful lookup)
+        api_key = get_api_key(self.API_KEY_NAME)
         if not api_key:
             error_msg = f"{self.name} is missing {self.API_KEY_NAME}. Ensure it's set in the environment/config."
             raise RuntimeError(error_msg)
@@ -192,36 +273,37 @@ class ElevenLabsGenerateMusic(DataNode):
             payload["force_instrumental"] = True
         # Note: composition_plan not supported in this node; could be a future extension
 
-        # HTTP request using httpx (same as working voice_changer node)
+        # HTTP request over the module-level pooled client
         base_url = "https://api.elevenlabs.io"
         url = f"{base_url}/v1/music?output_format={output_format}"
         headers = {
             "xi-api-key": api_key,
+            "content-type": "application/json",
         }
 
-        # Log request with truncated prompt for readability
-        prompt_for_log = prompt
-        if prompt and len(prompt) > self.PROMPT_TRUNCATE_LENGTH:
-            prompt_for_log = prompt[: self.PROMPT_TRUNCATE_LENGTH] + "..."
-        self._logger.info(
-            "GenerateMusic request: prompt=%s, prompt_len=%s, use_length=%s, duration_seconds=%s, music_length_ms=%s, force_instrumental=%s, output_format=%s, model_id=%s",
-            prompt_for_log if prompt else None,
-            len(prompt) if prompt else None,
-            use_length,
-            duration_seconds,
-            music_length_ms,
-            force_instrumental,
-            output_format,
-            model_id,
-        )
+        # Log request with truncated prompt for readability; skip the slicing when INFO is filtered out
+        if self._logger.isEnabledFor(logging.INFO):
+            prompt_for_log = prompt
+            if prompt_len > self.PROMPT_TRUNCATE_LENGTH:
+                prompt_for_log = prompt[: self.PROMPT_TRUNCATE_LENGTH] + "..."
+            self._logger.info(
+                "GenerateMusic request: prompt=%s, prompt_len=%s, use_length=%s, duration_seconds=%s, music_length_ms=%s, force_instrumental=%s, output_format=%s, model_id=%s",
+                prompt_for_log if prompt else None,
+                prompt_len or None,
+                use_length,
+                duration_seconds,
+                music_length_ms,
+                force_instrumental,
+                output_format,
+                model_id,
+            )
 
         resp_bytes: bytes | None = None
         try:
-            with httpx.Client(timeout=300.0) as client:
-                response = client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-                resp_bytes = response.content
+            resp_bytes = await self._request_music(url, dumps(payload), headers)
         except httpx.HTTPStatusError as e:
+            if e.response.status_code in (401, 403):
+                invalidate_api_key(self.API_KEY_NAME)
             self._logger.info("GenerateMusic HTTP error: %s - %s", e.response.status_code, e.response.text)
             error_message = self._parse_error_response(e.response.text, e.response.status_code)
             raise RuntimeError(error_message) from e
@@ -231,35 +313,116 @@ class ElevenLabsGenerateMusic(DataNode):
             raise RuntimeError(error_msg) from e_http
 
         # Save to project file
-        audio_artifact = None
-        if resp_bytes:
-            try:
-                # Guess extension from output_format
-                ext = "mp3"
-                if isinstance(output_format, str):
-                    if output_format.startswith("pcm"):
-                        ext = "wav"
-                    elif output_format.startswith("mp3"):
-                        ext = "mp3"
-                saved = self._output_file.build_file(default_filename=f"elevenlabs_music.{ext}").write_bytes(resp_bytes)
-                audio_artifact = AudioUrlArtifact(value=saved.location, name=saved.location)
-            except Exception as e_save:
-                try:
-                    b64 = base64.b64encode(resp_bytes).decode("ascii")
-                    mime = "audio/wav" if output_format.startswith("pcm") else "audio/mpeg"
-                    data_url = f"data:{mime};base64,{b64}"
-                    audio_artifact = AudioUrlArtifact(value=data_url, name="music")
-                    self._logger.info("GenerateMusic static save failed; used data URL: %s", e_save)
-                except Exception:
-                    audio_artifact = None
+        # File writes are blocking; keep them off the event loop
+        audio_artifact = await asyncio.to_thread(self._save_audio, resp_bytes, output_format) if resp_bytes else None
 
         self.parameter_output_values["audio"] = audio_artifact
 
+    def _save_audio(self, audio_bytes: bytes, output_format: str) -> AudioUrlArtifact | None:
+        """Save generated audio to the project, falling back to a data URL for small compressed renders."""
+        ext, mime = _FORMAT_META.get(output_format, _DEFAULT_FORMAT_META)
+
+        e_save: Exception | None = None
+        for attempt in range(self.SAVE_ATTEMPTS):
+            try:
+                saved = self._output_file.build_file(default_filename=f"elevenlabs_music.{ext}").write_bytes(
+                    audio_bytes
+                )
+                return AudioUrlArtifact(value=saved.location, name=saved.location)
+            except Exception as e:
+                e_save = e
+                self._logger.info("GenerateMusic project save attempt %s failed: %s", attempt + 1, e)
+
+        # Only small compressed renders are inlined; base64 of long PCM is huge and unplayable in the UI
+        if len(audio_bytes) <= self.DATA_URL_MAX_BYTES and not output_format.startswith("pcm"):
+            try:
+                b64 = base64.b64encode(audio_bytes).decode("ascii")
+                self._logger.info("GenerateMusic static save failed; used data URL: %s", e_save)
+                return AudioUrlArtifact(value=f"data:{mime};base64,{b64}", name="music")
+            except Exception:
+                return None
+
+        error_msg = (
+            f"{self.name}: could not save the generated music ({len(audio_bytes)} bytes) to the project: {e_save}. "
+            "Check that the project output directory is writable, then run the node again."
+        )
+        raise RuntimeError(error_msg) from e_save
+
+    async def _request_music(self, url: str, body: bytes, headers: dict[str, str]) -> bytes:
+        """POST the generation request and return the audio, retrying transient failures.
+
+        Only 429/5xx responses and connection-phase errors are retried: in those cases the server
+        has not accepted (and billed) the generation. Other errors raise httpx exceptions as usual.
+        """
+        client = _get_http_client()
+        inflight = _get_inflight_semaphore()
+        for attempt in range(self.MAX_ATTEMPTS):
+            is_last_attempt = attempt == self.MAX_ATTEMPTS - 1
+            try:
+                if inflight.locked():
+                    self._logger.info(
+                        "GenerateMusic waiting for a request slot (ELEVENLABS_MAX_INFLIGHT=%s)", _MAX_INFLIGHT
+                    )
+                async with (
+                    inflight,
+                    client.stream("POST", url, content=body, headers=headers) as response,
+                ):
+                    if response.status_code not in self.RETRY_STATUS_CODES or is_last_attempt:
+                        if response.is_error:
+                            # Load the error body so _parse_error_response can inspect it
+                            await response.aread()
+                        response.raise_for_status()
+                        # The project save only accepts a whole buffer, so read the body in one go
+                        return await response.aread()
+                    delay = self._retry_delay(attempt, response)
+                    self._logger.info(
+                        "GenerateMusic got HTTP %s; retrying in %.1fs (attempt %s/%s)",
+                        response.status_code,
+                        delay,
+                        attempt + 1,
+                        self.MAX_ATTEMPTS,
+                    )
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                if is_last_attempt:
+                    raise
+                delay = self._retry_delay(attempt)
+                self._logger.info(
+                    "GenerateMusic connection failed: %s; retrying in %.1fs (attempt %s/%s)",
+                    e,
+                    delay,
+                    attempt + 1,
+                    self.MAX_ATTEMPTS,
+                )
+            await asyncio.sleep(delay)
+
+        error_msg = f"{self.name}: music request was not attempted."
+        raise RuntimeError(error_msg)
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Full-jitter exponential backoff, deferring to a numeric Retry-After on 429s."""
+        delay = random.uniform(0, min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2**attempt))
+        if response is not None and response.status_code == 429:
+            try:
+                delay = max(delay, float(response.headers.get("retry-after", "")))
+            except ValueError:
+                pass
+        return min(delay, self.RETRY_MAX_DELAY)
+
     def _parse_error_response(self, response_text: str, status_code: int) -> str:
         """Parse error response and extract meaningful error information for the user."""
+        # Scan the raw body once; any mention of the music terms gets the acceptance hint appended
+        needs_terms = _MUSIC_TERMS_RE.search(response_text) is not None
+        help_suffix = _MUSIC_TERMS_HELP if needs_terms else ""
+
         try:
-            error_data = _json.loads(response_text)
+            error_data = loads(response_text)
+        except (ValueError, TypeError):
+            # Even if parsing fails, surface the music terms hint
+            if needs_terms:
+                return f"API Error ({status_code}): {response_text[:200]}{_MUSIC_TERMS_HELP}"
+            return f"API Error ({status_code}): Unable to parse error response"
 
+        if isinstance(error_data, dict):
             if "detail" in error_data:
                 detail = error_data["detail"]
                 if isinstance(detail, dict):
@@ -269,57 +432,18 @@ class ElevenLabsGenerateMusic(DataNode):
                     if status and message:
                         # Handle specific error cases with helpful messages
                         if status == "limited_access" and "music-terms" in message.lower():
-                            return (
-                                f"{status}: {message}\n\n"
-                                "To use Eleven Music, you need to accept the additional terms at "
-                                "https://elevenlabs.io/music-terms. Please visit the link to accept "
-                                "the terms, then try again."
-                            )
+                            return f"{status}: {message}{_MUSIC_TERMS_HELP}"
                         return f"{status}: {message}"
                     if message:
                         return f"Error: {message}"
                 elif isinstance(detail, str):
                     # Sometimes detail is a string
-                    if "music-terms" in detail.lower() or "limited_access" in detail.lower():
-                        return (
-                            f"Error: {detail}\n\n"
-                            "To use Eleven Music, you need to accept the additional terms at "
-                            "https://elevenlabs.io/music-terms. Please visit the link to accept "
-                            "the terms, then try again."
-                        )
-                    return f"Error: {detail}"
+                    return f"Error: {detail}{help_suffix}"
 
             if "error" in error_data:
                 error_msg = error_data["error"]
-                if isinstance(error_msg, str) and (
-                    "music-terms" in error_msg.lower() or "limited_access" in error_msg.lower()
-                ):
-                    return (
-                        f"Error: {error_msg}\n\n"
-                        "To use Eleven Music, you need to accept the additional terms at "
-                        "https://elevenlabs.io/music-terms. Please visit the link to accept "
-                        "the terms, then try again."
-                    )
+                if isinstance(error_msg, str):
+                    return f"Error: {error_msg}{help_suffix}"
                 return f"Error: {error_msg}"
 
-            # Check if the raw response text contains music terms reference
-            if "music-terms" in response_text.lower() or "limited_access" in response_text.lower():
-                return (
-                    f"API Error ({status_code}): {response_text[:200]}\n\n"
-                    "To use Eleven Music, you need to accept the additional terms at "
-                    "https://elevenlabs.io/music-terms. Please visit the link to accept "
-                    "the terms, then try again."
-                )
-
-            return f"API Error ({status_code}): {response_text[:200]}"
-
-        except (_json.JSONDecodeError, KeyError, TypeError):
-            # Even if parsing fails, check for music terms in raw text
-            if "music-terms" in response_text.lower() or "limited_access" in response_text.lower():
-                return (
-                    f"API Error ({status_code}): {response_text[:200]}\n\n"
-                    "To use Eleven Music, you need to accept the additional terms at "
-                    "https://elevenlabs.io/music-terms. Please visit the link to accept "
-                    "the terms, then try again."
-                )
-            return f"API Error ({status_code}): Unable to parse error response"
+        return f"API Error ({status_code}): {response_text[:200]}{help_suffix}"
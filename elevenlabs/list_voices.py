@@ -1,13 +1,85 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import math
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
+import httpx
+from elevenlabs_common import get_api_key, invalidate_api_key
 from griptape.artifacts.audio_url_artifact import AudioUrlArtifact
 from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
 from griptape_nodes.exe_types.node_types import DataNode
+from griptape_nodes.exe_types.param_types.parameter_bool import ParameterBool
+from xdg_base_dirs import xdg_cache_home
+
+# Fetched voice lists keyed by (api_key, fetch_limit) -> (monotonic fetch time, voices)
+_voices_cache: dict[tuple[str, int], tuple[float, list[dict[str, Any]]]] = {}
+
+logger = logging.getLogger("griptape_nodes")
+
+
+def _voice_record(voice: Any) -> dict[str, Any]:
+    """Reduce a voice (dict or SDK object) to the fields the slots display."""
+    field = dict.get if isinstance(voice, dict) else getattr
+    return {
+        "voice_id": field(voice, "voice_id", None),
+        "name": field(voice, "name", None),
+        "preview_url": field(voice, "preview_url", None),
+    }
+
+
+def _voices_cache_path(api_key: str, fetch_limit: int) -> Path:
+    # Scoped per account without writing the key itself to disk
+    digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return xdg_cache_home() / "griptape_nodes" / "elevenlabs" / f"voices_{digest}_{fetch_limit}.json"
+
+
+def _load_disk_voices(path: Path, ttl: float) -> tuple[float, list[dict[str, Any]]] | None:
+    """Return (age in seconds, voices) from the disk cache if it is younger than ttl."""
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age >= ttl:
+            return None
+        voices = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(voices, list) or not all(isinstance(v, dict) for v in voices):
+        return None
+    return age, voices
+
+
+def _store_disk_voices(path: Path, voices: list[dict[str, Any]]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(voices), encoding="utf-8")
+        # Atomic swap so a concurrent reader never sees a partial file
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.info("ListVoices could not write voices cache %s: %s", path, e)
+
+
+# Preview URLs are played by the UI straight from ElevenLabs' CDN. A background HEAD per newly listed
+# preview warms DNS/TLS and the CDN edge so the first click doesn't pay for it; failures are ignored.
+_preview_client = httpx.Client(timeout=2.0, follow_redirects=True)
+_preview_warmup_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="elevenlabs-preview-warmup")
+# Warmed preview URLs in insertion order; capped so a long session doesn't accumulate every URL ever listed
+_warmed_preview_urls: OrderedDict[str, None] = OrderedDict()
+WARMED_PREVIEW_URLS_MAX_ENTRIES = 1024
+
+
+def _warm_preview_url(url: str) -> None:
+    try:
+        _preview_client.head(url)
+    except Exception:
+        _warmed_preview_urls.pop(url, None)
 
 
 class ElevenLabsListVoices(DataNode):
@@ -24,6 +96,14 @@ class ElevenLabsListVoices(DataNode):
 
     PAGE_SIZE: int = 10
     FETCH_LIMIT: int = 100
+    VOICES_CACHE_TTL: float = 60.0
+    VOICES_DISK_CACHE_TTL: float = 600.0
+
+    # (voice_id, name, preview) parameter names per slot, formatted once per process
+    SLOT_PARAM_NAMES: tuple[tuple[str, str, str], ...] = tuple(
+        (f"voice_id_{i}", f"name_{i}", f"preview_{i}") for i in range(1, PAGE_SIZE + 1)
+    )
+    ALL_SLOT_PARAM_NAMES: tuple[str, ...] = tuple(name for names in SLOT_PARAM_NAMES for name in names)
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
@@ -48,6 +128,16 @@ class ElevenLabsListVoices(DataNode):
             )
         )
 
+        self.add_parameter(
+            ParameterBool(
+                name="force_refresh",
+                default_value=False,
+                tooltip="If true, always fetch voices from ElevenLabs instead of reusing the list fetched in the last minute.",
+                allowed_modes={ParameterMode.PROPERTY},
+                ui_options={"display_name": "Force Refresh"},
+            )
+        )
+
         # Internal flag to control initial visibility
         self.add_parameter(
             Parameter(
@@ -62,10 +152,11 @@ class ElevenLabsListVoices(DataNode):
         )
 
         # Outputs per slot (hidden until first successful run)
-        for i in range(1, 11):
-            self.add_parameter(
+        add_parameter = self.add_parameter
+        for i, (id_param, name_param, prev_param) in enumerate(self.SLOT_PARAM_NAMES, start=1):
+            add_parameter(
                 Parameter(
-                    name=f"voice_id_{i}",
+                    name=id_param,
                     output_type="str",
                     type="str",
                     tooltip=f"Voice ID #{i}",
@@ -73,9 +164,9 @@ class ElevenLabsListVoices(DataNode):
                     ui_options={"display_name": f"Voice ID {i}", "hide_property": True},
                 )
             )
-            self.add_parameter(
+            add_parameter(
                 Parameter(
-                    name=f"name_{i}",
+                    name=name_param,
                     input_types=["str"],
                     type="str",
                     tooltip=f"Voice name for slot {i}",
@@ -83,9 +174,9 @@ class ElevenLabsListVoices(DataNode):
                     ui_options={"display_name": f"Voice {i}", "disabled": True},
                 )
             )
-            self.add_parameter(
+            add_parameter(
                 Parameter(
-                    name=f"preview_{i}",
+                    name=prev_param,
                     output_type="AudioUrlArtifact",
                     type="AudioArtifact",
                     tooltip=f"Preview #{i}",
@@ -108,14 +199,32 @@ class ElevenLabsListVoices(DataNode):
 
         # Explicitly hide all per-slot params and total_pages so no ports/labels render until run
         try:
-            for i in range(1, 11):
-                self.hide_parameter_by_name(f"voice_id_{i}")
-                self.hide_parameter_by_name(f"name_{i}")
-                self.hide_parameter_by_name(f"preview_{i}")
-            self.hide_parameter_by_name("total_pages")
+            self.hide_parameter_by_name([*self.ALL_SLOT_PARAM_NAMES, "total_pages"])
         except Exception:
             pass
 
+    def _fetch_voices(self, api_key: str) -> list[Any]:
+        """Fetch up to FETCH_LIMIT voices from the account."""
+        try:
+            from elevenlabs import ElevenLabs  # type: ignore
+        except Exception as e:
+            error_msg = "elevenlabs package not installed. Add 'elevenlabs' to library dependencies."
+            raise ImportError(error_msg) from e
+
+        client = ElevenLabs(api_key=api_key)
+
+        try:
+            voices_resp = client.voices.search(include_total_count=True, page_size=self.FETCH_LIMIT)  # type: ignore[attr-defined]
+        except Exception as e:
+            if getattr(e, "status_code", None) in (401, 403):
+                invalidate_api_key(self.API_KEY_ENV_VAR)
+            raise
+
+        # Only the voices list is used; read it directly rather than dumping the whole response model
+        if isinstance(voices_resp, dict):
+            return voices_resp.get("voices") or []
+        return list(getattr(voices_resp, "voices", None) or [])
+
     # Re-run when page changes; hide results while reloading
     def after_value_set(self, parameter: Parameter, value: Any) -> None:
         try:
@@ -137,55 +246,42 @@ class ElevenLabsListVoices(DataNode):
             pass
 
     def process(self) -> Any:
-        # Resolve and cache API key before scheduling background work
-        try:
-            self._resolved_api_key = self.get_config_value(value=self.API_KEY_ENV_VAR)  # type: ignore[attr-defined]
-        except Exception:
-            self._resolved_api_key = None  # type: ignore[attr-defined]
-        if not getattr(self, "_resolved_api_key", None):  # type: ignore[attr-defined]
-            self._resolved_api_key = os.environ.get(self.API_KEY_ENV_VAR)  # type: ignore[attr-defined]
-
         yield lambda: self._run()
 
+    def _is_parameter_hidden(self, name: str) -> bool:
+        parameter = self.get_parameter_by_name(name)
+        return parameter is None or bool(parameter.hide)
+
     def _run(self) -> None:
         page: int = int(self.get_parameter_value("page") or 1)
 
-        api_key: str | None = getattr(self, "_resolved_api_key", None)
-        if not api_key:
-            try:
-                api_key = self.get_config_value(value=self.API_KEY_ENV_VAR)  # type: ignore[attr-defined]
-            except Exception:
-                api_key = os.environ.get(self.API_KEY_ENV_VAR)
+        api_key = get_api_key(self.API_KEY_ENV_VAR)
         if not api_key:
             error_msg = "Missing ELEVEN_LABS_API_KEY. Set it in system config or environment."
             raise RuntimeError(error_msg)
 
-        try:
-            from elevenlabs import ElevenLabs  # type: ignore
-        except Exception as e:
-            error_msg = "elevenlabs package not installed. Add 'elevenlabs' to library dependencies."
-            raise ImportError(error_msg) from e
-
-        client = ElevenLabs(api_key=api_key)
-
-        # Fetch up to 100 voices (no local cache persisted; every run pulls fresh)
-        voices_resp = client.voices.search(include_total_count=True, page_size=self.FETCH_LIMIT)  # type: ignore[attr-defined]
-
-        # Normalize result
-        if hasattr(voices_resp, "model_dump"):
-            data = voices_resp.model_dump()  # type: ignore[attr-defined]
-        elif hasattr(voices_resp, "to_dict"):
-            data = voices_resp.to_dict()  # type: ignore[attr-defined]
-        elif isinstance(voices_resp, dict):
-            data = voices_resp
+        force_refresh = bool(self.get_parameter_value("force_refresh"))
+
+        # Page changes re-run the node; reuse the recent fetch since pages are slices of the same list.
+        # The disk copy only covers engine restarts: it is read when this process has no entry yet, and an
+        # expired in-memory entry always refetches.
+        cache_key = (api_key, self.FETCH_LIMIT)
+        disk_path = _voices_cache_path(api_key, self.FETCH_LIMIT)
+        cached = None if force_refresh else _voices_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.VOICES_CACHE_TTL:
+            voices = cached[1]
+        elif (
+            not force_refresh
+            and cached is None
+            and (on_disk := _load_disk_voices(disk_path, self.VOICES_DISK_CACHE_TTL))
+        ):
+            age, voices = on_disk
+            _voices_cache[cache_key] = (time.monotonic() - age, voices)
         else:
-            data = {
-                k: getattr(voices_resp, k)
-                for k in dir(voices_resp)
-                if not k.startswith("_") and not callable(getattr(voices_resp, k))
-            }
+            voices = [_voice_record(v) for v in self._fetch_voices(api_key)]
+            _voices_cache[cache_key] = (time.monotonic(), voices)
+            _store_disk_voices(disk_path, voices)
 
-        voices = data.get("voices") or []
         total = len(voices)
         total_pages = max(1, math.ceil(min(total, self.FETCH_LIMIT) / self.PAGE_SIZE))
 
@@ -195,46 +291,54 @@ class ElevenLabsListVoices(DataNode):
         end = start + self.PAGE_SIZE
         page_items = voices[start:end]
 
-        # Clear then hide all slots before repopulating
-        for i in range(1, 11):
-            self.parameter_output_values[f"voice_id_{i}"] = None
-            self.parameter_output_values[f"name_{i}"] = ""
-            self.parameter_output_values[f"preview_{i}"] = None
-            try:
-                self.hide_parameter_by_name(f"voice_id_{i}")
-                self.hide_parameter_by_name(f"name_{i}")
-                self.hide_parameter_by_name(f"preview_{i}")
-            except Exception:
-                pass
-
-        # Populate current page and reveal populated slots
-        for idx, v in enumerate(page_items, start=1):
-            if idx > 10:
-                break
-            vid = v.get("voice_id") if isinstance(v, dict) else getattr(v, "voice_id", None)
-            name = v.get("name") if isinstance(v, dict) else getattr(v, "name", None)
-            preview_url = v.get("preview_url") if isinstance(v, dict) else getattr(v, "preview_url", None)
-
-            id_param = f"voice_id_{idx}"
-            name_param = f"name_{idx}"
-            prev_param = f"preview_{idx}"
+        # Populated slots are always a prefix. Trailing slots are always cleared, since a reloaded workflow can
+        # restore outputs from an earlier run. Visibility is read from the parameters themselves, so only slots
+        # whose visibility actually changes are shown/hidden.
+        populated = len(page_items)
+        preview_urls: list[str] = []
+        for v, (id_param, name_param, prev_param) in zip(page_items, self.SLOT_PARAM_NAMES, strict=False):
+            vid = v.get("voice_id")
+            name = v.get("name")
+            preview_url = v.get("preview_url")
 
             self.parameter_output_values[id_param] = vid
             self.parameter_output_values[name_param] = name or ""
             if preview_url:
+                preview_urls.append(str(preview_url))
                 self.parameter_output_values[prev_param] = AudioUrlArtifact(value=str(preview_url))
             else:
                 self.parameter_output_values[prev_param] = None
 
-            try:
-                self.show_parameter_by_name(id_param)
-                self.show_parameter_by_name(name_param)
-                self.show_parameter_by_name(prev_param)
-            except Exception:
-                pass
-
-        # Set total pages for UI and reveal it
+        for id_param, name_param, prev_param in self.SLOT_PARAM_NAMES[populated:]:
+            self.parameter_output_values[id_param] = None
+            self.parameter_output_values[name_param] = ""
+            self.parameter_output_values[prev_param] = None
+        shown: list[str] = []
+        hidden: list[str] = []
+        for i, names in enumerate(self.SLOT_PARAM_NAMES):
+            if i < populated:
+                shown.extend(name for name in names if self._is_parameter_hidden(name))
+            else:
+                hidden.extend(name for name in names if not self._is_parameter_hidden(name))
         self.parameter_output_values["total_pages"] = total_pages
+
+        # Fire and forget; the run doesn't wait on the warmup requests
+        for url in preview_urls:
+            if url not in _warmed_preview_urls:
+                _warmed_preview_urls[url] = None
+                while len(_warmed_preview_urls) > WARMED_PREVIEW_URLS_MAX_ENTRIES:
+                    _warmed_preview_urls.popitem(last=False)
+                _preview_warmup_executor.submit(_warm_preview_url, url)
+
+        try:
+            if hidden:
+                self.hide_parameter_by_name(hidden)
+            if shown:
+                self.show_parameter_by_name(shown)
+        except Exception:
+            pass
+
+        # Reveal total pages for UI
         try:
             self.show_parameter_by_name("total_pages")
         except Exception:
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import logging
-import os
 from typing import Any
-from urllib.request import urlopen
 
+import httpx
+from elevenlabs_common import get_api_key, invalidate_api_key
 from griptape.artifacts.audio_url_artifact import AudioUrlArtifact
 from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
 from griptape_nodes.exe_types.node_types import DataNode
 from griptape_nodes.exe_types.param_components.project_file_parameter import ProjectFileParameter
 
+# Pooled across runs so preview downloads reuse the keep-alive connection to ElevenLabs' CDN
+_preview_client = httpx.Client(
+    timeout=15.0,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=10, max_keepalive_connections=4),
+)
+
 
 class ElevenLabsSaveVoice(DataNode):
     """Create an ElevenLabs voice from a selected preview (generated_voice_id).
@@ -112,17 +119,14 @@ class ElevenLabsSaveVoice(DataNode):
         )
 
     def process(self) -> Any:
-        # Resolve and cache API key before scheduling background work
-        try:
-            self._resolved_api_key = self.get_config_value(value=self.API_KEY_ENV_VAR)  # type: ignore[attr-defined]
-        except Exception:
-            self._resolved_api_key = None  # type: ignore[attr-defined]
-        if not getattr(self, "_resolved_api_key", None):  # type: ignore[attr-defined]
-            self._resolved_api_key = os.environ.get(self.API_KEY_ENV_VAR)  # type: ignore[attr-defined]
+        # Resolve the API key once, before scheduling background work
+        api_key = get_api_key(self.API_KEY_ENV_VAR)
+        if not api_key:
+            raise RuntimeError("Missing ELEVEN_LABS_API_KEY. Set it in system config or environment.")
 
-        yield lambda: self._run()
+        yield lambda: self._run(api_key)
 
-    def _run(self) -> None:
+    def _run(self, api_key: str) -> None:
         # Collect inputs
         gen_id: str | None = self.get_parameter_value("generated_voice_id")
         voice_name: str | None = self.get_parameter_value("voice_name")
@@ -137,18 +141,6 @@ class ElevenLabsSaveVoice(DataNode):
         if not voice_description or len(voice_description) < 20 or len(voice_description) > 1000:
             raise ValueError("voice_description must be between 20 and 1000 characters.")
 
-        # Resolve API key
-        api_key: str | None = getattr(self, "_resolved_api_key", None)
-        if not api_key:
-            try:
-                api_key = self.get_config_value(value=self.API_KEY_ENV_VAR)
-            except Exception:
-                api_key = None
-        if not api_key:
-            api_key = os.environ.get(self.API_KEY_ENV_VAR)
-        if not api_key:
-            raise RuntimeError("Missing ELEVEN_LABS_API_KEY. Set it in system config or environment.")
-
         # Call API
         try:
             from elevenlabs import ElevenLabs
@@ -165,27 +157,29 @@ class ElevenLabsSaveVoice(DataNode):
             bool(labels),
         )
 
-        response = client.text_to_voice.create(
-            voice_name=voice_name,
-            voice_description=voice_description,
-            generated_voice_id=gen_id,
-            labels=labels,
-        )
+        try:
+            response = client.text_to_voice.create(
+                voice_name=voice_name,
+                voice_description=voice_description,
+                generated_voice_id=gen_id,
+                labels=labels,
+            )
+        except Exception as e:
+            if getattr(e, "status_code", None) in (401, 403):
+                invalidate_api_key(self.API_KEY_ENV_VAR)
+            raise
 
         # Normalize response to dict
         voice_dict: dict[str, Any]
         if isinstance(response, dict):
             voice_dict = response
-        elif hasattr(response, "model_dump"):
-            voice_dict = response.model_dump()  # type: ignore[attr-defined]
-        elif hasattr(response, "to_dict"):
-            voice_dict = response.to_dict()  # type: ignore[attr-defined]
+        elif (model_dump := getattr(response, "model_dump", None)) is not None:
+            voice_dict = model_dump()
+        elif (to_dict := getattr(response, "to_dict", None)) is not None:
+            voice_dict = to_dict()
         else:
-            voice_dict = {
-                k: getattr(response, k)
-                for k in dir(response)
-                if not k.startswith("_") and not callable(getattr(response, k))
-            }
+            # Plain objects keep their fields in __dict__; avoid walking dir() and its descriptors
+            voice_dict = {k: v for k, v in getattr(response, "__dict__", {}).items() if not k.startswith("_")}
 
         voice_id = voice_dict.get("voice_id")
         preview_url = voice_dict.get("preview_url")
@@ -205,10 +199,11 @@ class ElevenLabsSaveVoice(DataNode):
         preview_artifact = None
         if preview_url:
             try:
-                data = urlopen(preview_url, timeout=15).read()
+                preview_response = _preview_client.get(preview_url)
+                preview_response.raise_for_status()
                 saved = self._output_file.build_file(
                     default_filename=f"elevenlabs_{voice_id or 'voice'}_preview.mp3"
-                ).write_bytes(data)
+                ).write_bytes(preview_response.content)
                 preview_artifact = AudioUrlArtifact(value=saved.location)
             except Exception:
                 try:
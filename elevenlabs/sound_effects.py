@@ -1,16 +1,73 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import contextlib
+import importlib.util
+import inspect
 import logging
-import os
-from collections.abc import Iterable
+import threading
+import weakref
+from collections.abc import AsyncIterable, Iterable
 from typing import Any
 
+import httpx
+from elevenlabs_common import get_api_key, invalidate_api_key
 from griptape.artifacts.audio_url_artifact import AudioUrlArtifact
 from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
 from griptape_nodes.exe_types.node_types import DataNode
 from griptape_nodes.exe_types.param_components.project_file_parameter import ProjectFileParameter
 
+# Async clients are bound to the event loop they first connect on, so the transport and the SDK clients
+# built on it are kept per loop. Concurrent sound-effect runs multiplex over one connection when the
+# optional h2 package is installed, and fall back to pooled HTTP/1.1 otherwise.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+_sdk_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE, limits=httpx.Limits(max_keepalive_connections=8), timeout=120.0
+        )
+        _http_clients[loop] = client
+        _sdk_clients.pop(loop, None)
+    return client
+
+
+def _get_client(api_key: str) -> Any:
+    # One SDK client per key so repeated runs reuse its connection pool and keep-alive sockets
+    http_client = _get_http_client()
+    clients = _sdk_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        try:
+            from elevenlabs import AsyncElevenLabs  # type: ignore
+        except Exception as e:
+            raise ImportError("elevenlabs package not installed. Add 'elevenlabs' to library dependencies.") from e
+
+        try:
+            client = AsyncElevenLabs(api_key=api_key, httpx_client=http_client)
+        except TypeError:
+            # Older SDK releases don't accept a custom transport
+            client = AsyncElevenLabs(api_key=api_key)
+        clients[api_key] = client
+    return client
+
+
+def _content_length(headers: Any) -> int | None:
+    for key, value in dict(headers or {}).items():
+        if key.lower() == "content-length":
+            try:
+                length = int(value)
+            except (TypeError, ValueError):
+                return None
+            return length if length > 0 else None
+    return None
+
 
 class ElevenLabsSoundEffects(DataNode):
     """Generate a sound effect from text using ElevenLabs and output a playable URL.
@@ -29,6 +86,18 @@ class ElevenLabsSoundEffects(DataNode):
     API_KEY_ENV_VAR: str = "ELEVEN_LABS_API_KEY"
     _logger = logging.getLogger("griptape_nodes")
 
+    # Streaming progress is logged at most once per this many received bytes
+    STREAM_LOG_INTERVAL = 256 * 1024
+
+    # Join buffers kept for reuse across runs; a few at most, and none larger than the cap
+    BUFFER_POOL_SIZE = 4
+    BUFFER_POOL_MAX_BYTES = 8 * 1024 * 1024
+    _BUFFER_POOL: list[bytearray] = []
+    _BUFFER_POOL_LOCK = threading.Lock()
+
+    # Keyword names accepted by the installed SDK's convert(); resolved on first use
+    _CONVERT_PARAMS: frozenset[str] | None = None
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
@@ -111,87 +180,211 @@ class ElevenLabsSoundEffects(DataNode):
             )
         )
 
-    def process(self) -> Any:
-        # Resolve API key before scheduling work
+    def process(self) -> None:
+        pass
+
+    async def aprocess(self) -> None:
+        # Resolve the API key once, before scheduling work
+        api_key = get_api_key(self.API_KEY_ENV_VAR)
+        if not api_key:
+            raise RuntimeError("Missing ELEVEN_LABS_API_KEY. Set it in system config or environment.")
+
         try:
-            self._resolved_api_key = self.get_config_value(value=self.API_KEY_ENV_VAR)  # type: ignore[attr-defined]
-        except Exception:
-            self._resolved_api_key = None  # type: ignore[attr-defined]
-        if not getattr(self, "_resolved_api_key", None):  # type: ignore[attr-defined]
-            self._resolved_api_key = os.environ.get(self.API_KEY_ENV_VAR)  # type: ignore[attr-defined]
+            await self._process_async(api_key)
+        except Exception as e:
+            if getattr(e, "status_code", None) in (401, 403):
+                invalidate_api_key(self.API_KEY_ENV_VAR)
+            raise
 
-        yield lambda: self._run()
+    @classmethod
+    def _convert_params(cls, convert: Any) -> frozenset[str]:
+        if cls._CONVERT_PARAMS is None:
+            try:
+                cls._CONVERT_PARAMS = frozenset(inspect.signature(convert).parameters)
+            except (TypeError, ValueError):
+                # Signature not introspectable; assume the current SDK names
+                cls._CONVERT_PARAMS = frozenset(("text", "duration_seconds", "loop"))
+        return cls._CONVERT_PARAMS
 
     def _sniff_audio_extension(self, data: bytes) -> str:
-        try:
-            if len(data) >= 4 and data[:4] == b"RIFF" and b"WAVE" in data[:32]:
-                return "wav"
-            if len(data) >= 3 and data[:3] == b"ID3":
-                return "mp3"
-            if len(data) >= 2 and data[:2] == b"\xff\xfb":
-                return "mp3"
-            if len(data) >= 4 and data[:4] == b"OggS":
-                return "ogg"
-        except Exception:
-            pass
+        # RIFF/WAVE and Ogg are the only containers that change the extension; ID3-tagged or bare
+        # MPEG frames and anything unrecognised are saved as mp3
+        if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+            return "wav"
+        if data[:4] == b"OggS":
+            return "ogg"
         return "mp3"
 
-    def _join_iterable_bytes(self, it: Iterable[Any]) -> bytes | None:
-        chunks = []
-        total = 0
+    @classmethod
+    def _acquire_buffer(cls, size: int) -> bytearray:
+        with cls._BUFFER_POOL_LOCK:
+            buf = cls._BUFFER_POOL.pop() if cls._BUFFER_POOL else None
+        if buf is not None and len(buf) >= size:
+            return buf
+        # Pool miss, or a pooled buffer too small for this body: allocate once at the hinted size instead of
+        # growing through a zero-filled temporary. A dropped small buffer leaves its slot to this larger one.
+        return bytearray(size)
+
+    @classmethod
+    def _release_buffer(cls, buf: bytearray) -> None:
+        if len(buf) > cls.BUFFER_POOL_MAX_BYTES:
+            return
+        with cls._BUFFER_POOL_LOCK:
+            if len(cls._BUFFER_POOL) < cls.BUFFER_POOL_SIZE:
+                cls._BUFFER_POOL.append(buf)
+
+    async def _join_iterable_bytes(
+        self, it: Iterable[Any] | AsyncIterable[Any], size_hint: int | None = None
+    ) -> bytes | None:
+        # Chunks are copied into one buffer, reused across runs and pre-sized from Content-Length when the
+        # server sent one, so they are never held alongside the joined copy
+        buf = self._acquire_buffer(size_hint or 0)
+        view = memoryview(buf)
+        filled = 0
+        log_enabled = self._logger.isEnabledFor(logging.INFO)
+        next_log_at = self.STREAM_LOG_INTERVAL
+
+        def append(part: Any) -> None:
+            nonlocal filled, next_log_at, view
+            if not isinstance(part, (bytes, bytearray, memoryview)):
+                # Non-byte chunk; ignore
+                return
+            end = filled + len(part)
+            if end <= len(buf):
+                view[filled:end] = part
+            else:
+                # Out of room: drop the unfilled tail and grow from here
+                view.release()
+                del buf[filled:]
+                buf.extend(part)
+                view = memoryview(buf)
+            filled = end
+            if log_enabled and filled >= next_log_at:
+                self._logger.info("SoundEffects streaming: received %s bytes so far", filled)
+                next_log_at = filled + self.STREAM_LOG_INTERVAL
+
         try:
-            for idx, part in enumerate(it):
-                if isinstance(part, (bytes, bytearray)):
-                    chunks.append(bytes(part))
-                    total += len(part)
-                    if idx % 10 == 0:
-                        try:
-                            self._logger.info("SoundEffects streaming: received %s bytes so far", total)
-                        except Exception:
-                            pass
-                else:
-                    # Non-byte chunk; ignore
-                    continue
-            return b"".join(chunks) if chunks else None
+            if isinstance(it, AsyncIterable):
+                async for part in it:
+                    append(part)
+            else:
+                for part in it:
+                    append(part)
+            return bytes(view[:filled]) if filled else None
         except Exception as e:
             try:
                 self._logger.info("SoundEffects iterable join failed: %s", e)
             except Exception:
                 pass
             return None
+        finally:
+            view.release()
+            self._release_buffer(buf)
 
-    def _run(self) -> None:
-        text: str | None = self.get_parameter_value("text")
+    def _api_metadata(self, response: Any) -> Any:
+        to_dict = getattr(response, "model_dump", None) or getattr(response, "to_dict", None)
+        return to_dict() if to_dict is not None else None
+
+    def _normalize_bytes(self, response: bytes | bytearray) -> tuple[bytes | None, dict[str, Any]]:
+        audio_bytes = bytes(response)
+        self._logger.info("SoundEffects received bytes: %s", len(audio_bytes))
+        return audio_bytes, {"response": {"type": type(response).__name__, "byte_length": len(audio_bytes)}}
+
+    def _normalize_dict(self, response: dict[str, Any]) -> tuple[bytes | None, dict[str, Any]]:
+        self._logger.info("SoundEffects dict keys: %s", list(response)[:10])
+        # Preserve API-provided fields under 'api'
+        meta_patch: dict[str, Any] = {"api": response}
+        audio_b64 = response.get("audio_base_64") or response.get("audio_base64")
+        if not isinstance(audio_b64, str):
+            return None, meta_patch
+        try:
+            audio_bytes = base64.b64decode(audio_b64)
+        except Exception as e_b64:
+            self._logger.info("SoundEffects base64 decode failed: %s", e_b64)
+            return None, meta_patch
+        self._logger.info("SoundEffects decoded base64 bytes: %s", len(audio_bytes))
+        meta_patch["response"] = {"type": "base64", "byte_length": len(audio_bytes)}
+        # Kept so a data-URL fallback can reuse the API's encoding; popped before metadata is output
+        meta_patch["_audio_b64_raw"] = audio_b64
+        return audio_bytes, meta_patch
+
+    def _normalize_object(self, response: Any) -> tuple[bytes | None, dict[str, Any]]:
+        # Best-effort: inspect attributes
+        meta_patch: dict[str, Any] = {}
+        audio_bytes: bytes | None = None
+        try:
+            audio_attr = getattr(response, "audio", None)
+            if isinstance(audio_attr, (bytes, bytearray)):
+                audio_bytes = bytes(audio_attr)
+                self._logger.info("SoundEffects response.audio bytes: %s", len(audio_bytes))
+            elif isinstance(audio_attr, str):
+                try:
+                    audio_bytes = base64.b64decode(audio_attr)
+                    self._logger.info("SoundEffects response.audio base64 decoded: %s", len(audio_bytes))
+                except Exception as e_a:
+                    self._logger.info("SoundEffects audio str decode failed: %s", e_a)
+            api_meta = self._api_metadata(response)
+            if api_meta is not None:
+                meta_patch["api"] = api_meta
+            if audio_bytes is not None:
+                meta_patch["response"] = {"type": "attr", "byte_length": len(audio_bytes)}
+        except Exception as e_norm:
+            self._logger.info("SoundEffects normalization failed: %s", e_norm)
+        return audio_bytes, meta_patch
+
+    async def _normalize_response(
+        self, response: Any, size_hint: int | None = None
+    ) -> tuple[bytes | None, dict[str, Any]]:
+        """Extract audio bytes from an SDK response, plus the metadata entries describing it."""
+        if isinstance(response, (bytes, bytearray)):
+            return self._normalize_bytes(response)
+        if isinstance(response, dict):
+            return self._normalize_dict(response)
+        if not isinstance(response, (AsyncIterable, Iterable)) or isinstance(response, str):
+            return self._normalize_object(response)
+
+        self._logger.info("SoundEffects response is iterable; joining chunks…")
+        audio_bytes = await self._join_iterable_bytes(response, size_hint)
+        byte_length = len(audio_bytes) if audio_bytes else None
+        self._logger.info("SoundEffects joined bytes: %s", byte_length)
+        meta_patch: dict[str, Any] = {"response": {"type": "iterable", "byte_length": byte_length}}
+        # Try to extract metadata if possible
+        try:
+            api_meta = self._api_metadata(response)
+        except Exception:
+            api_meta = None
+        if api_meta is not None:
+            meta_patch["api"] = api_meta
+        return audio_bytes, meta_patch
+
+    def _emit_audio(
+        self, url: str, filename: str, ext: str | None, saved: bool, metadata: dict[str, Any]
+    ) -> AudioUrlArtifact:
+        """Publish the audio artifact for ``url`` and record where it lives in ``metadata["file"]``."""
+        audio_artifact = AudioUrlArtifact(value=url, name=filename)
+        try:
+            self.publish_update_to_parameter("audio", audio_artifact)
+        except Exception as e_pub:
+            self._logger.info("SoundEffects publish update failed: %s", e_pub)
+        metadata["file"] = {"url": url, "filename": filename, "ext": ext, "saved_to_static": saved}
+        return audio_artifact
+
+    async def _process_async(self, api_key: str) -> None:
+        get_value = self.get_parameter_value
+        text: str | None = get_value("text")
         if not text or not isinstance(text, str) or len(text.strip()) == 0:
             raise ValueError("text is required to generate a sound effect.")
 
         # Optional params
-        use_duration: bool = bool(self.get_parameter_value("use_specific_duration"))
-        duration_val: float | None = self.get_parameter_value("duration_seconds")
+        use_duration: bool = bool(get_value("use_specific_duration"))
+        duration_val: float | None = get_value("duration_seconds")
         try:
             duration: float | None = float(duration_val) if (use_duration and duration_val is not None) else None
         except Exception:
             duration = None
-        looping: bool = bool(self.get_parameter_value("looping"))
-
-        # Resolve API key
-        api_key: str | None = getattr(self, "_resolved_api_key", None)
-        if not api_key:
-            try:
-                api_key = self.get_config_value(value=self.API_KEY_ENV_VAR)
-            except Exception:
-                api_key = None
-        if not api_key:
-            api_key = os.environ.get(self.API_KEY_ENV_VAR)
-        if not api_key:
-            raise RuntimeError("Missing ELEVEN_LABS_API_KEY. Set it in system config or environment.")
+        looping: bool = bool(get_value("looping"))
 
-        try:
-            from elevenlabs import ElevenLabs  # type: ignore
-        except Exception as e:
-            raise ImportError("elevenlabs package not installed. Add 'elevenlabs' to library dependencies.") from e
-
-        client = ElevenLabs(api_key=api_key)
+        client = _get_client(api_key)
 
         # Call the Text-to-Sound-Effects API
         self._logger.info(
@@ -204,7 +397,13 @@ class ElevenLabsSoundEffects(DataNode):
         if not use_duration:
             self._logger.info("SoundEffects will NOT include duration (lower credit cost).")
 
-        # Build kwargs dynamically to avoid passing None
+        # The raw variant exposes the response headers, so the audio buffer can be sized up front
+        sfx = client.text_to_sound_effects
+        raw_sfx = getattr(sfx, "with_raw_response", None)
+        convert = raw_sfx.convert if raw_sfx is not None else sfx.convert
+
+        # Build kwargs dynamically to avoid passing None, using whichever names this SDK release accepts
+        params = self._convert_params(convert)
         kwargs: dict[str, Any] = {"text": text}
         if use_duration and duration is not None:
             # Clamp to API range for safety
@@ -212,30 +411,21 @@ class ElevenLabsSoundEffects(DataNode):
                 duration = 0.1
             if duration > 30.0:
                 duration = 30.0
-            kwargs["duration_seconds"] = duration
+            duration_key = next((k for k in ("duration_seconds", "duration") if k in params), None)
+            if duration_key is not None:
+                kwargs[duration_key] = duration
         if looping:
-            # First-attempt param name
-            kwargs["loop"] = True
+            loop_key = next((k for k in ("loop", "looping") if k in params), None)
+            if loop_key is not None:
+                kwargs[loop_key] = True
 
-        # Try with best-known signature, then fallbacks
         try:
-            response = client.text_to_sound_effects.convert(**kwargs)
-        except TypeError as e1:
-            self._logger.info("SoundEffects convert signature mismatch (v1): %s; trying fallbacks…", e1)
-            # Try alternate names
-            alt_kwargs = {"text": text}
-            if use_duration and duration is not None:
-                alt_kwargs["duration"] = duration
-            if looping:
-                alt_kwargs["looping"] = True
-            try:
-                response = client.text_to_sound_effects.convert(**alt_kwargs)
-            except TypeError as e2:
-                self._logger.info("SoundEffects convert signature mismatch (v2): %s; trying minimal…", e2)
-                response = client.text_to_sound_effects.convert(text=text)
+            response = convert(**kwargs)
         except Exception as e_call:
             self._logger.info("SoundEffects API call failed: %s", e_call)
             raise
+        if inspect.isawaitable(response):
+            response = await response
 
         # Response is often audio bytes; add robust normalization and logging.
         # Seed metadata with request info so UI always sees something useful
@@ -247,82 +437,18 @@ class ElevenLabsSoundEffects(DataNode):
                 "looping": looping,
             }
         }
-        audio_bytes: bytes | None = None
-        file_url: str | None = None
-        file_name: str | None = None
-        file_ext: str | None = None
-
-        try:
-            self._logger.info("SoundEffects response type: %s", type(response).__name__)
-        except Exception:
-            pass
 
-        if isinstance(response, (bytes, bytearray)):
-            audio_bytes = bytes(response)
-            try:
-                self._logger.info("SoundEffects received bytes: %s", len(audio_bytes))
-            except Exception:
-                pass
-            metadata["response"] = {"type": type(response).__name__, "byte_length": len(audio_bytes)}
-        elif isinstance(response, dict):
-            try:
-                keys = list(response.keys())[:10]
-                self._logger.info("SoundEffects dict keys: %s", keys)
-            except Exception:
-                pass
-            # Preserve API-provided fields under 'api'
-            metadata["api"] = response
-            audio_b64 = response.get("audio_base_64") or response.get("audio_base64")
-            if isinstance(audio_b64, str):
-                try:
-                    audio_bytes = base64.b64decode(audio_b64)
-                    self._logger.info("SoundEffects decoded base64 bytes: %s", len(audio_bytes))
-                    metadata["response"] = {"type": "base64", "byte_length": len(audio_bytes)}
-                except Exception as e_b64:
-                    self._logger.info("SoundEffects base64 decode failed: %s", e_b64)
-                    audio_bytes = None
-        elif hasattr(response, "__iter__") and not isinstance(response, (str, bytes, bytearray)):
-            self._logger.info("SoundEffects response is iterable; joining chunks…")
-            audio_bytes = self._join_iterable_bytes(response)  # type: ignore[arg-type]
-            try:
-                self._logger.info("SoundEffects joined bytes: %s", len(audio_bytes) if audio_bytes else None)
-            except Exception:
-                pass
-            metadata["response"] = {"type": "iterable", "byte_length": len(audio_bytes) if audio_bytes else None}
-            # Try to extract metadata if possible
-            if hasattr(response, "model_dump"):
-                try:
-                    metadata["api"] = response.model_dump()  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-            elif hasattr(response, "to_dict"):
-                try:
-                    metadata["api"] = response.to_dict()  # type: ignore[attr-defined]
-                except Exception:
-                    pass
+        if isinstance(response, contextlib.AbstractAsyncContextManager):
+            async with response as raw_response:
+                self._logger.info("SoundEffects response type: %s", type(raw_response.data).__name__)
+                audio_bytes, meta_patch = await self._normalize_response(
+                    raw_response.data, _content_length(raw_response.headers)
+                )
         else:
-            # Best-effort: inspect attributes
-            try:
-                audio_attr = getattr(response, "audio", None)
-                if isinstance(audio_attr, (bytes, bytearray)):
-                    audio_bytes = bytes(audio_attr)
-                    self._logger.info("SoundEffects response.audio bytes: %s", len(audio_bytes))
-                elif isinstance(audio_attr, str):
-                    try:
-                        audio_bytes = base64.b64decode(audio_attr)
-                        self._logger.info("SoundEffects response.audio base64 decoded: %s", len(audio_bytes))
-                    except Exception as e_a:
-                        self._logger.info("SoundEffects audio str decode failed: %s", e_a)
-                        audio_bytes = None
-                # Try model_dump/to_dict for metadata
-                if hasattr(response, "model_dump"):
-                    metadata["api"] = response.model_dump()  # type: ignore[attr-defined]
-                elif hasattr(response, "to_dict"):
-                    metadata["api"] = response.to_dict()  # type: ignore[attr-defined]
-                if audio_bytes is not None:
-                    metadata["response"] = {"type": "attr", "byte_length": len(audio_bytes)}
-            except Exception as e_norm:
-                self._logger.info("SoundEffects normalization failed: %s", e_norm)
+            self._logger.info("SoundEffects response type: %s", type(response).__name__)
+            audio_bytes, meta_patch = await self._normalize_response(response)
+        metadata.update(meta_patch)
+        audio_b64_raw: str | None = metadata.pop("_audio_b64_raw", None)
 
         # Save to static files when we have bytes; fallback to data URL otherwise
         audio_artifact = None
@@ -330,40 +456,26 @@ class ElevenLabsSoundEffects(DataNode):
             try:
                 file_ext = self._sniff_audio_extension(audio_bytes)
                 self._logger.info("Saving sound effect to project storage (bytes=%s)", len(audio_bytes))
-                saved = self._output_file.build_file(default_filename=f"elevenlabs_sfx.{file_ext}").write_bytes(
-                    audio_bytes
-                )
-                file_url = saved.location
-                file_name = saved.location
-                audio_artifact = AudioUrlArtifact(value=file_url, name=file_name)  # type: ignore
-                try:
-                    self.publish_update_to_parameter("audio", audio_artifact)
-                    self._logger.info("SoundEffects published audio artifact: %s", file_url)
-                except Exception as e_pub:
-                    self._logger.info("SoundEffects publish update failed: %s", e_pub)
-                metadata["file"] = {
-                    "url": file_url,
-                    "filename": file_name,
-                    "ext": file_ext,
-                    "saved_to_static": True,
-                }
+                destination = self._output_file.build_file(default_filename=f"elevenlabs_sfx.{file_ext}")
+                saved = await asyncio.to_thread(destination.write_bytes, audio_bytes)
+                audio_artifact = self._emit_audio(saved.location, saved.location, file_ext, True, metadata)
+                self._logger.info("SoundEffects published audio artifact: %s", saved.location)
             except Exception as e_save:
                 # Fallback to data URL if save fails
                 try:
-                    b64 = base64.b64encode(audio_bytes).decode("ascii")
-                    data_url = f"data:audio/mpeg;base64,{b64}"
-                    audio_artifact = AudioUrlArtifact(value=data_url, name="sound_effect.mp3")  # type: ignore
+                    if audio_b64_raw is not None:
+                        # The API already sent base64; reuse it rather than re-encoding the decoded bytes
+                        data_url = (
+                            audio_b64_raw
+                            if audio_b64_raw.startswith("data:")
+                            else "data:audio/mpeg;base64," + audio_b64_raw
+                        )
+                    else:
+                        # Built in one expression so the encoded bytes and their str copy are released
+                        # before the artifact is created, rather than living alongside the final URL
+                        data_url = "data:audio/mpeg;base64," + base64.b64encode(audio_bytes).decode("ascii")
                     self._logger.info("Static save failed; using data URL. %s", e_save)
-                    try:
-                        self.publish_update_to_parameter("audio", audio_artifact)
-                    except Exception:
-                        pass
-                    metadata["file"] = {
-                        "url": data_url,
-                        "filename": "sound_effect.mp3",
-                        "ext": "mp3",
-                        "saved_to_static": False,
-                    }
+                    audio_artifact = self._emit_audio(data_url, "sound_effect.mp3", "mp3", False, metadata)
                 except Exception as e_data:
                     self._logger.info("SoundEffects data URL fallback failed: %s", e_data)
                     audio_artifact = None
@@ -372,36 +484,16 @@ class ElevenLabsSoundEffects(DataNode):
             api_meta = metadata.get("api", {})
             audio_url = api_meta.get("url") or api_meta.get("audio_url")
             if isinstance(audio_url, str):
-                audio_artifact = AudioUrlArtifact(value=audio_url, name="sound_effect")  # type: ignore
-                try:
-                    self.publish_update_to_parameter("audio", audio_artifact)
-                    self._logger.info("SoundEffects using URL from metadata: %s", audio_url)
-                except Exception:
-                    pass
-                metadata["file"] = {
-                    "url": audio_url,
-                    "filename": "sound_effect",
-                    "ext": None,
-                    "saved_to_static": False,
-                }
+                audio_artifact = self._emit_audio(audio_url, "sound_effect", None, False, metadata)
+                self._logger.info("SoundEffects using URL from metadata: %s", audio_url)
             else:
                 audio_b64 = api_meta.get("audio_base_64") or api_meta.get("audio_base64")
                 if isinstance(audio_b64, str):
                     try:
                         if not audio_b64.startswith("data:"):
                             audio_b64 = f"data:audio/mpeg;base64,{audio_b64}"
-                        audio_artifact = AudioUrlArtifact(value=audio_b64, name="sound_effect.mp3")  # type: ignore
-                        try:
-                            self.publish_update_to_parameter("audio", audio_artifact)
-                        except Exception:
-                            pass
+                        audio_artifact = self._emit_audio(audio_b64, "sound_effect.mp3", "mp3", False, metadata)
                         self._logger.info("SoundEffects built data URL from metadata base64")
-                        metadata["file"] = {
-                            "url": audio_b64,
-                            "filename": "sound_effect.mp3",
-                            "ext": "mp3",
-                            "saved_to_static": False,
-                        }
                     except Exception as e_meta:
                         self._logger.info("SoundEffects metadata base64 handling failed: %s", e_meta)
                         audio_artifact = None
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib.util
 import json as _json
 import logging
+import random
+import time
+import weakref
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
+from elevenlabs_common import dumps, loads, orjson
 from griptape.artifacts.audio_url_artifact import AudioUrlArtifact
 from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMessage, ParameterMode
 from griptape_nodes.exe_types.node_types import SuccessFailureNode
@@ -20,24 +29,107 @@ logger = logging.getLogger(__name__)
 
 PROMPT_TRUNCATE_LENGTH = 100
 
+# Stability choices -> voice_settings.stability values sent to the API
+STABILITY_MAP = {"Creative": 0.0, "Natural": 0.5, "Robust": 1.0}
+
+
+# Async clients are bound to the event loop they first connect on, so keep one per loop; generations and
+# preview lookups on the same loop share its pooled TLS connections to the API. HTTP/2 is only negotiated
+# when the optional h2 package is installed.
+_http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(300.0, connect=10.0),
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+# Voice preview lookups keyed by (api_key, voice_id) -> (monotonic expiry, preview_url, error message).
+# Preview URLs are effectively static per voice, so flipping back to a voice already seen needs no request.
+_preview_cache: OrderedDict[tuple[str, str], tuple[float, str | None, str | None]] = OrderedDict()
+
+# Background task that warms _preview_cache for every preset voice; started by the first node created inside a
+# running event loop and kept here so it is not garbage collected mid-flight
+_preview_prewarm_task: asyncio.Task | None = None
+
 # Voice preset mapping - friendly names to Eleven Labs voice IDs (sorted alphabetically)
-VOICE_PRESET_MAP = {  # spellchecker:disable-line
-    "Alexandra": "kdmDKE6EkgrWrrykO9Qt",  # spellchecker:disable-line
-    "Antoni": "ErXwobaYiN019PkySvjV",  # spellchecker:disable-line
-    "Austin": "Bj9UqZbhQsanLzgalpEG",  # spellchecker:disable-line
-    "Clyde": "2EiwWnXFnvU5JabPnv8n",  # spellchecker:disable-line
-    "Dave": "CYw3kZ02Hs0563khs1Fj",  # spellchecker:disable-line
-    "Domi": "AZnzlk1XvdvUeBnXmlld",  # spellchecker:disable-line
-    "Drew": "29vD33N1CtxCmqQRPOHJ",  # spellchecker:disable-line
-    "Fin": "D38z5RcWu1voky8WS1ja",  # spellchecker:disable-line
-    "Hope": "tnSpp4vdxKPjI9w0GnoV",  # spellchecker:disable-line
-    "James": "EkK5I93UQWFDigLMpZcX",  # spellchecker:disable-line
-    "Jane": "RILOU7YmBhvwJGDGjNmP",  # spellchecker:disable-line
-    "Paul": "5Q0t7uMcjvnagumLfvZi",  # spellchecker:disable-line
-    "Rachel": "21m00Tcm4TlvDq8ikWAM",  # spellchecker:disable-line
-    "Sarah": "EXAVITQu4vr4xnSDxMaL",  # spellchecker:disable-line
-    "Thomas": "GBv7mTt0atIp3Br8iCZE",  # spellchecker:disable-line
+VOICE_PRESET_MAP = MappingProxyType(
+    {  # spellchecker:disable-line
+        "Alexandra": "kdmDKE6EkgrWrrykO9Qt",  # spellchecker:disable-line
+        "Antoni": "ErXwobaYiN019PkySvjV",  # spellchecker:disable-line
+        "Austin": "Bj9UqZbhQsanLzgalpEG",  # spellchecker:disable-line
+        "Clyde": "2EiwWnXFnvU5JabPnv8n",  # spellchecker:disable-line
+        "Dave": "CYw3kZ02Hs0563khs1Fj",  # spellchecker:disable-line
+        "Domi": "AZnzlk1XvdvUeBnXmlld",  # spellchecker:disable-line
+        "Drew": "29vD33N1CtxCmqQRPOHJ",  # spellchecker:disable-line
+        "Fin": "D38z5RcWu1voky8WS1ja",  # spellchecker:disable-line
+        "Hope": "tnSpp4vdxKPjI9w0GnoV",  # spellchecker:disable-line
+        "James": "EkK5I93UQWFDigLMpZcX",  # spellchecker:disable-line
+        "Jane": "RILOU7YmBhvwJGDGjNmP",  # spellchecker:disable-line
+        "Paul": "5Q0t7uMcjvnagumLfvZi",  # spellchecker:disable-line
+        "Rachel": "21m00Tcm4TlvDq8ikWAM",  # spellchecker:disable-line
+        "Sarah": "EXAVITQu4vr4xnSDxMaL",  # spellchecker:disable-line
+        "Thomas": "GBv7mTt0atIp3Br8iCZE",  # spellchecker:disable-line
+    }
+)
+
+# Per-model capabilities: whether previous_text/next_text context is accepted, and the request character limit
+_MODEL_CAPS: dict[str, dict[str, Any]] = {
+    "eleven_v3": {"supports_context": False, "max_chars": 3000},
+    "eleven_multilingual_v2": {"supports_context": True, "max_chars": 10000},
+    "eleven_turbo_v2_5": {"supports_context": True, "max_chars": 40000},
+    "eleven_flash_v2_5": {"supports_context": True, "max_chars": 40000},
+    "eleven_turbo_v2": {"supports_context": True, "max_chars": 30000},
+    "eleven_flash_v2": {"supports_context": True, "max_chars": 30000},
+    "eleven_monolingual_v1": {"supports_context": True, "max_chars": 10000},
 }
+# Models not in the table are passed through unchecked; the API reports anything it rejects
+_DEFAULT_MODEL_CAPS: dict[str, Any] = {"supports_context": True, "max_chars": None}
+
+# Dropdown order for the voice selector; Options stores the list it is given, so each node gets a copy
+VOICE_CHOICES = (*VOICE_PRESET_MAP, "Custom...")
+
+
+# Error bodies are usually small and identical across a burst of failures (e.g. a bad API key),
+# so cache parsed messages; larger bodies are parsed uncached to keep cache keys bounded
+ERROR_CACHE_MAX_BODY_LENGTH = 2048
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_error_cached(status_code: int, response_text: str) -> str:
+    try:
+        error_data = loads(response_text)
+
+        if "detail" in error_data:
+            detail = error_data["detail"]
+            if isinstance(detail, dict):
+                status = detail.get("status", "")
+                message = detail.get("message", "")
+                if status and message:
+                    return f"{status}: {message}"
+                if message:
+                    return f"Error: {message}"
+            elif isinstance(detail, str):
+                return f"Error: {detail}"
+
+        if "error" in error_data:
+            error_msg = error_data["error"]
+            if isinstance(error_msg, str):
+                return f"Error: {error_msg}"
+
+        return f"API Error ({status_code}): {response_text[:200]}"
+
+    except Exception:
+        return f"API Error ({status_code}): Unable to parse error response"
 
 
 class ElevenLabsTextToSpeech(SuccessFailureNode):
@@ -53,22 +145,42 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
     SERVICE_NAME = "ElevenLabs"
     API_KEY_NAME = "ELEVEN_LABS_API_KEY"
 
+    # Successful preview lookups are reused for an hour; rejected voice ids are retried after a minute
+    PREVIEW_CACHE_TTL = 3600.0
+    PREVIEW_ERROR_CACHE_TTL = 60.0
+    PREVIEW_CACHE_MAX_ENTRIES = 128
+
+    # Upper bound on concurrent generation requests when text is a list; ElevenLabs enforces per-plan concurrency
+    BATCH_MAX_CONCURRENCY = 4
+
+    # Transient-failure retries for the generation request
+    MAX_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 8.0
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.category = "ElevenLabs.Audio"
         self.description = "Generate speech from text using ElevenLabs text-to-speech API"
 
-        # ElevenLabs API base URL
+        # ElevenLabs API base URL, and the endpoint prefixes the request paths append a voice id to
         self._api_base = "https://api.elevenlabs.io/v1/"
+        self._tts_url_prefix = urljoin(self._api_base, "text-to-speech/")
+        self._voices_url_prefix = urljoin(self._api_base, "voices/")
+        self._tts_headers: dict[str, str] | None = None
+
+        # In-flight voice preview lookup, cancelled when the selected voice changes again
+        self._preview_task: asyncio.Task[None] | None = None
 
         # INPUTS / PROPERTIES
         # Text input
         self.add_parameter(
             Parameter(
                 name="text",
-                input_types=["str"],
+                input_types=["str", "list"],
                 type="str",
-                tooltip="Text to convert to speech",
+                tooltip="Text to convert to speech, or a list of texts to generate as separate clips",
                 allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
                 ui_options={
                     "multiline": True,
@@ -119,28 +231,7 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
                 default_value="Alexandra",
                 tooltip="Select a preset voice or choose 'Custom...' to enter a voice ID",
                 allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
-                traits={
-                    Options(
-                        choices=[
-                            "Alexandra",
-                            "Antoni",
-                            "Austin",
-                            "Clyde",
-                            "Dave",
-                            "Domi",
-                            "Drew",
-                            "Fin",
-                            "Hope",
-                            "James",
-                            "Jane",
-                            "Paul",
-                            "Rachel",
-                            "Sarah",
-                            "Thomas",
-                            "Custom...",
-                        ]
-                    )
-                },
+                traits={Options(choices=list(VOICE_CHOICES))},
                 ui_options={"display_name": "Voice"},
             )
         )
@@ -260,7 +351,7 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
                 allow_input=True,
                 allow_property=True,
                 allow_output=False,
-                traits={Options(choices=["Creative", "Natural", "Robust"])},
+                traits={Options(choices=list(STABILITY_MAP))},
             )
             ParameterFloat(
                 name="speed",
@@ -290,6 +381,16 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
                 ui_options={"display_name": "Audio", "pulse_on_run": True},
             )
         )
+        self.add_parameter(
+            Parameter(
+                name="audio_list",
+                output_type="list",
+                type="list",
+                tooltip="Generated speech clips, one per input text (a single clip when text is a string)",
+                allowed_modes={ParameterMode.OUTPUT},
+                ui_options={"hide_property": True},
+            )
+        )
 
         # Alignment outputs
         self.add_parameter(
@@ -311,14 +412,15 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
         )
 
         # Initialize visibility based on default model
-        # Hide previous_text and next_text if default model is eleven_v3
+        # Hide previous_text and next_text if the default model doesn't support them (eleven_v3)
         default_model = self.get_parameter_value("model_id") or "eleven_multilingual_v2"
-        if default_model == "eleven_v3":
+        if not _MODEL_CAPS.get(default_model, _DEFAULT_MODEL_CAPS)["supports_context"]:
             self.hide_parameter_by_name("previous_text")
             self.hide_parameter_by_name("next_text")
 
         # Fetch voice preview for the default voice on node creation
         self._fetch_voice_preview()
+        self._start_preview_prewarm()
 
     def after_value_set(self, parameter: Parameter, value: Any) -> None:
         """Update parameter visibility and fetch voice preview based on voice preset selection."""
@@ -337,8 +439,8 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
                 self.set_parameter_value("voice_preview", None, emit_change=False)
 
         if parameter.name == "model_id":
-            # Hide previous_text and next_text for eleven_v3 (not supported)
-            if value == "eleven_v3":
+            # Hide previous_text and next_text for models that don't support them (eleven_v3)
+            if not _MODEL_CAPS.get(value, _DEFAULT_MODEL_CAPS)["supports_context"]:
                 self.hide_parameter_by_name("previous_text")
                 self.hide_parameter_by_name("next_text")
             else:
@@ -358,13 +460,26 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
             )
 
         text = self.get_parameter_value("text")
-        if not text or not text.strip():
+        texts = text if isinstance(text, list) else [text]
+        if not texts or not all(isinstance(item, str) and item.strip() for item in texts):
             errors.append(ValueError(f"{self.name}: Text input is required."))
+        else:
+            # Fail fast on over-long text rather than after a long round trip to the API
+            model_id = self.get_parameter_value("model_id") or "eleven_multilingual_v2"
+            max_chars = _MODEL_CAPS.get(model_id, _DEFAULT_MODEL_CAPS)["max_chars"]
+            longest = max(len(item) for item in texts)
+            if max_chars is not None and longest > max_chars:
+                errors.append(
+                    ValueError(
+                        f"{self.name}: Text is {longest} characters, but {model_id} accepts at most {max_chars}."
+                    )
+                )
 
         return errors or None
 
     def _log(self, message: str) -> None:
-        logger.info(f"{self.name}: {message}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s: %s", self.name, message)
 
     def process(self) -> None:
         pass
@@ -398,9 +513,13 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
         self._log(f"Generating speech with voice {voice_id} via ElevenLabs API")
 
         try:
-            response_bytes = await self._submit_request(voice_id, params, api_key)
-            if response_bytes:
-                self._handle_response(response_bytes)
+            texts = params["text"]
+            if isinstance(texts, list):
+                responses = await self._submit_batch(voice_id, params, texts, api_key)
+            else:
+                responses = [await self._submit_request(voice_id, params, api_key)]
+            if all(responses):
+                await self._handle_response(responses)
                 self._set_status_results(was_successful=True, result_details="Speech generated successfully")
             else:
                 self._set_safe_defaults()
@@ -427,7 +546,89 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
 
         return None
 
+    def _show_voice_preview(self, preview_url: str) -> None:
+        self.set_parameter_value("voice_preview", AudioUrlArtifact(value=preview_url), emit_change=True)
+        self.error_message.value = ""
+        self.hide_message_by_name("error_message")
+        self.show_parameter_by_name("voice_preview")
+
+    def _show_voice_preview_error(self, error_message: str) -> None:
+        self.error_message.value = error_message
+        self.show_message_by_name("error_message")
+        self.hide_parameter_by_name("voice_preview")
+        self.set_parameter_value("voice_preview", None, emit_change=False)
+
+    def _cache_voice_preview(
+        self, cache_key: tuple[str, str], preview_url: str | None, error_message: str | None = None
+    ) -> None:
+        ttl = self.PREVIEW_CACHE_TTL if preview_url else self.PREVIEW_ERROR_CACHE_TTL
+        _preview_cache[cache_key] = (time.monotonic() + ttl, preview_url, error_message)
+        _preview_cache.move_to_end(cache_key)
+        while len(_preview_cache) > self.PREVIEW_CACHE_MAX_ENTRIES:
+            _preview_cache.popitem(last=False)
+
     def _fetch_voice_preview(self) -> None:
+        """Resolve the voice preview in the background when an event loop is running.
+
+        A lookup still in flight for a previously selected voice is cancelled.
+        """
+        if self._preview_task is not None and not self._preview_task.done():
+            self._preview_task.cancel()
+        self._preview_task = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._fetch_voice_preview_once())
+            return
+        self._preview_task = loop.create_task(self._fetch_voice_preview_async())
+
+    def _start_preview_prewarm(self) -> None:
+        """Warm the preview cache for all preset voices, once per process, when an event loop is running."""
+        global _preview_prewarm_task  # noqa: PLW0603
+        if _preview_prewarm_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        api_key = GriptapeNodes.SecretsManager().get_secret(self.API_KEY_NAME)
+        if not api_key:
+            return
+        _preview_prewarm_task = loop.create_task(self._prewarm_preview_cache(api_key))
+
+    async def _prewarm_preview_cache(self, api_key: str) -> None:
+        """Fetch preview URLs for all preset voices concurrently so switching presets hits the cache."""
+        client = _get_http_client()
+        headers = {"xi-api-key": api_key}
+
+        async def fetch(voice_id: str) -> None:
+            cache_key = (api_key, voice_id)
+            if cache_key in _preview_cache:
+                return
+            response = await client.get(self._voices_url_prefix + voice_id, headers=headers, timeout=10.0)
+            response.raise_for_status()
+            preview_url = response.json().get("preview_url")
+            # Only successes are cached here; failures are left for the interactive path to report
+            if preview_url:
+                self._cache_voice_preview(cache_key, str(preview_url))
+
+        results = await asyncio.gather(
+            *(fetch(voice_id) for voice_id in VOICE_PRESET_MAP.values()), return_exceptions=True
+        )
+        failures = sum(isinstance(result, BaseException) for result in results)
+        if failures:
+            self._log(f"Voice preview prewarm: {failures} of {len(results)} lookups failed")
+
+    async def _fetch_voice_preview_once(self) -> None:
+        # The loop is discarded afterwards, so close the client it pooled instead of leaking its sockets
+        try:
+            await self._fetch_voice_preview_async()
+        finally:
+            client = _http_clients.pop(asyncio.get_running_loop(), None)
+            if client is not None:
+                await client.aclose()
+
+    async def _fetch_voice_preview_async(self) -> None:
         """Fetch and set the preview URL for the selected voice."""
         voice_id = self._get_voice_id()
         if not voice_id:
@@ -446,79 +647,79 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
                 self.show_message_by_name("error_message")
                 return
 
+            cache_key = (api_key, voice_id)
+            cached = _preview_cache.get(cache_key)
+            if cached is not None:
+                expires_at, preview_url, error_message = cached
+                if time.monotonic() < expires_at:
+                    if preview_url:
+                        self._show_voice_preview(preview_url)
+                    else:
+                        self._show_voice_preview_error(error_message or "")
+                    return
+                del _preview_cache[cache_key]
+
             headers = {"xi-api-key": api_key}
 
             self._log(f"Fetching voice preview for voice_id: {voice_id}")
 
             # Try direct voice endpoint
-            url = urljoin(self._api_base, f"voices/{voice_id}")
-
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url, headers=headers)
-
-                # Handle specific error cases with detailed error messages
-                if response.status_code == 400:
-                    error_text = response.text
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get("detail", {}).get("message", error_text)
-                    except Exception:
-                        error_msg = error_text
-                    self._log(f"Voice ID '{voice_id}' error (400 Bad Request): {error_msg}")
-                    error_message = (
-                        f"Voice '{voice_id}' is not accessible. \n\n"
-                        "To use voices from the Voice Library, you must first add them to 'My Voices' "
-                        "at https://elevenlabs.io/app/voice-library. "
-                        "Once added to your account, the voice preview will be available."
-                    )
-                    self.error_message.value = error_message
-                    self.show_message_by_name("error_message")
-                    self.hide_parameter_by_name("voice_preview")
-                    self.set_parameter_value("voice_preview", None, emit_change=False)
-                    return
-                if response.status_code == 404:
-                    self._log(f"Voice ID '{voice_id}' not found (404 Not Found)")
-                    error_message = (
-                        f"Voice '{voice_id}' not found in your account. "
-                        "To use voices from the Voice Library, you must first add them to 'My Voices' "
-                        "at https://elevenlabs.io/app/voice-library. "
-                        "Once added to your account, the voice preview will be available."
-                    )
-                    self.error_message.value = error_message
-                    self.show_message_by_name("error_message")
-                    self.hide_parameter_by_name("voice_preview")
-                    self.set_parameter_value("voice_preview", None, emit_change=False)
-                    return
-                if response.status_code == 401:
-                    self._log("Unauthorized - API key may be invalid or voice is private")
-                    error_message = (
-                        "Unauthorized access. The API key may be invalid, or the voice is private. "
-                        "To use voices from the Voice Library, you must first add them to 'My Voices' "
-                        "at https://elevenlabs.io/app/voice-library."
-                    )
-                    self.error_message.value = error_message
-                    self.show_message_by_name("error_message")
-                    self.hide_parameter_by_name("voice_preview")
-                    self.set_parameter_value("voice_preview", None, emit_change=False)
-                    return
+            url = self._voices_url_prefix + voice_id
+
+            response = await _get_http_client().get(url, headers=headers, timeout=10.0)
+
+            # Handle specific error cases with detailed error messages
+            if response.status_code == 400:
+                error_text = response.text
+                try:
+                    error_data = response.json()
+                    error_msg = error_data.get("detail", {}).get("message", error_text)
+                except Exception:
+                    error_msg = error_text
+                self._log(f"Voice ID '{voice_id}' error (400 Bad Request): {error_msg}")
+                error_message = (
+                    f"Voice '{voice_id}' is not accessible. \n\n"
+                    "To use voices from the Voice Library, you must first add them to 'My Voices' "
+                    "at https://elevenlabs.io/app/voice-library. "
+                    "Once added to your account, the voice preview will be available."
+                )
+                self._cache_voice_preview(cache_key, None, error_message)
+                self._show_voice_preview_error(error_message)
+                return
+            if response.status_code == 404:
+                self._log(f"Voice ID '{voice_id}' not found (404 Not Found)")
+                error_message = (
+                    f"Voice '{voice_id}' not found in your account. "
+                    "To use voices from the Voice Library, you must first add them to 'My Voices' "
+                    "at https://elevenlabs.io/app/voice-library. "
+                    "Once added to your account, the voice preview will be available."
+                )
+                self._cache_voice_preview(cache_key, None, error_message)
+                self._show_voice_preview_error(error_message)
+                return
+            if response.status_code == 401:
+                self._log("Unauthorized - API key may be invalid or voice is private")
+                error_message = (
+                    "Unauthorized access. The API key may be invalid, or the voice is private. "
+                    "To use voices from the Voice Library, you must first add them to 'My Voices' "
+                    "at https://elevenlabs.io/app/voice-library."
+                )
+                self._cache_voice_preview(cache_key, None, error_message)
+                self._show_voice_preview_error(error_message)
+                return
 
-                response.raise_for_status()
-                voice_data = response.json()
-
-                preview_url = voice_data.get("preview_url")
-                if preview_url:
-                    preview_artifact = AudioUrlArtifact(value=str(preview_url))
-                    self.set_parameter_value("voice_preview", preview_artifact, emit_change=True)
-                    self.error_message.value = ""
-                    self.hide_message_by_name("error_message")
-                    self.show_parameter_by_name("voice_preview")
-                    self._log(f"Successfully fetched voice preview: {preview_url}")
-                else:
-                    self._log("Voice data does not contain preview_url")
-                    self.set_parameter_value("voice_preview", None, emit_change=False)
-                    self.error_message.value = "Voice data does not contain preview_url"
-                    self.show_message_by_name("error_message")
-                    self.hide_parameter_by_name("voice_preview")
+            response.raise_for_status()
+            voice_data = response.json()
+
+            preview_url = voice_data.get("preview_url")
+            if preview_url:
+                self._cache_voice_preview(cache_key, str(preview_url))
+                self._show_voice_preview(str(preview_url))
+                self._log(f"Successfully fetched voice preview: {preview_url}")
+            else:
+                self._log("Voice data does not contain preview_url")
+                self._cache_voice_preview(cache_key, None, "Voice data does not contain preview_url")
+                self._show_voice_preview_error("Voice data does not contain preview_url")
         except httpx.HTTPStatusError as e:
             error_text = e.response.text
             try:
@@ -532,10 +733,7 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
                 "To use voices from the Voice Library, you must first add them to 'My Voices' "
                 "at https://elevenlabs.io/app/voice-library."
             )
-            self.error_message.value = error_message
-            self.show_message_by_name("error_message")
-            self.hide_parameter_by_name("voice_preview")
-            self.set_parameter_value("voice_preview", None, emit_change=False)
+            self._show_voice_preview_error(error_message)
         except Exception as e:
             self._log(f"Failed to fetch voice preview: {e}")
             error_message = (
@@ -543,54 +741,46 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
                 "To use voices from the Voice Library, you must first add them to 'My Voices' "
                 "at https://elevenlabs.io/app/voice-library."
             )
-            self.error_message.value = error_message
-            self.show_message_by_name("error_message")
-            self.hide_parameter_by_name("voice_preview")
-            self.set_parameter_value("voice_preview", None, emit_change=False)
+            self._show_voice_preview_error(error_message)
 
     def _get_parameters(self) -> dict[str, Any]:
-        text = self.get_parameter_value("text") or ""
-        model_id = self.get_parameter_value("model_id") or "eleven_multilingual_v2"
-        language_code = self.get_parameter_value("language_code")
-        seed = self.get_parameter_value("seed")
-        previous_text = self.get_parameter_value("previous_text")
-        next_text = self.get_parameter_value("next_text")
-        stability_str = self.get_parameter_value("stability")
-        speed = self.get_parameter_value("speed")
+        get_value = self.get_parameter_value
+        model_id = get_value("model_id") or "eleven_multilingual_v2"
 
         params: dict[str, Any] = {
-            "text": text,
+            "text": get_value("text") or "",
             "model_id": model_id,
         }
 
         # Add optional parameters if they have values
+        language_code = get_value("language_code")
         if language_code:
             params["language_code"] = language_code
+        seed = get_value("seed")
         if seed is not None and seed != -1:
             params["seed"] = seed
 
-        # previous_text and next_text are not supported with eleven_v3
-        if model_id != "eleven_v3":
+        # previous_text and next_text are not supported with eleven_v3, so they are only read otherwise
+        if _MODEL_CAPS.get(model_id, _DEFAULT_MODEL_CAPS)["supports_context"]:
+            previous_text = get_value("previous_text")
             if previous_text:
                 params["previous_text"] = previous_text
+            next_text = get_value("next_text")
             if next_text:
                 params["next_text"] = next_text
 
         # Add voice_settings with stability and speed
         voice_settings = {}
 
+        stability_str = get_value("stability")
         if stability_str is not None:
-            match stability_str:
-                case "Creative":
-                    voice_settings["stability"] = 0.0
-                case "Natural":
-                    voice_settings["stability"] = 0.5
-                case "Robust":
-                    voice_settings["stability"] = 1.0
-                case _:
-                    msg = f"{self.name} received invalid stability value: {stability_str}. Must be one of: Creative, Natural, or Robust"
-                    raise ValueError(msg)
+            stability = STABILITY_MAP.get(stability_str)
+            if stability is None:
+                msg = f"{self.name} received invalid stability value: {stability_str}. Must be one of: Creative, Natural, or Robust"
+                raise ValueError(msg)
+            voice_settings["stability"] = stability
 
+        speed = get_value("speed")
         if speed is not None:
             voice_settings["speed"] = speed
 
@@ -609,21 +799,22 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
 
     async def _submit_request(self, voice_id: str, params: dict[str, Any], api_key: str) -> bytes | None:
         """Submit request to ElevenLabs text-to-speech API (direct API, not proxy)."""
-        url = urljoin(self._api_base, f"text-to-speech/{voice_id}")
-
-        headers = {
-            "xi-api-key": api_key,
-            "Content-Type": "application/json",
-            "Accept": "audio/mpeg",
-        }
-
-        self._log(f"Submitting request to ElevenLabs API: {url}")
+        url = self._tts_url_prefix + voice_id
+
+        # Static apart from the key, so only rebuilt when the key changes
+        headers = self._tts_headers
+        if headers is None or headers["xi-api-key"] != api_key:
+            headers = self._tts_headers = {
+                "xi-api-key": api_key,
+                "Content-Type": "application/json",
+                "Accept": "audio/mpeg",
+            }
+
+        logger.info("%s: Submitting request to ElevenLabs API: %s", self.name, url)
         self._log_request(params)
 
         try:
-            async with httpx.AsyncClient(timeout=300.0) as client:
-                response = await client.post(url, json=params, headers=headers)
-                response.raise_for_status()
+            audio = await self._post_with_retries(url, dumps(params), headers)
         except httpx.HTTPStatusError as e:
             self._log(f"HTTP error: {e.response.status_code} - {e.response.text}")
             error_message = self._parse_error_response(e.response.text, e.response.status_code)
@@ -634,56 +825,117 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
             raise RuntimeError(msg) from e
 
         self._log("Request submitted successfully")
-        return response.content
+        return audio
 
-    def _parse_error_response(self, response_text: str, status_code: int) -> str:
-        """Parse error response and extract meaningful error information."""
+    async def _submit_batch(
+        self, voice_id: str, params: dict[str, Any], texts: list[str], api_key: str
+    ) -> list[bytes | None]:
+        """Generate one clip per text concurrently over the shared client, preserving input order."""
+        semaphore = asyncio.Semaphore(self.BATCH_MAX_CONCURRENCY)
+
+        async def submit(text: str) -> bytes | None:
+            async with semaphore:
+                return await self._submit_request(voice_id, {**params, "text": text}, api_key)
+
+        self._log(f"Generating {len(texts)} clips concurrently")
         try:
-            error_data = _json.loads(response_text)
-
-            if "detail" in error_data:
-                detail = error_data["detail"]
-                if isinstance(detail, dict):
-                    status = detail.get("status", "")
-                    message = detail.get("message", "")
-                    if status and message:
-                        return f"{status}: {message}"
-                    if message:
-                        return f"Error: {message}"
-                elif isinstance(detail, str):
-                    return f"Error: {detail}"
-
-            if "error" in error_data:
-                error_msg = error_data["error"]
-                if isinstance(error_msg, str):
-                    return f"Error: {error_msg}"
-
-            return f"API Error ({status_code}): {response_text[:200]}"
+            # Unlike gather, the task group cancels the clips still queued or in flight once one fails,
+            # so a doomed batch stops starting (and paying for) further generations
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(submit(text)) for text in texts]
+        except ExceptionGroup as e:
+            # Surface the first failure as-is so the status message stays readable
+            raise e.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+    async def _post_with_retries(self, url: str, body: bytes, headers: dict[str, str]) -> bytes:
+        """POST the generation request and return the audio, retrying transient failures.
+
+        Only 429/5xx responses and connection-phase errors are retried: in those cases the server
+        has not accepted (and billed) the generation. Other errors raise httpx exceptions as usual.
+        """
+        client = _get_http_client()
+        for attempt in range(self.MAX_ATTEMPTS):
+            is_last_attempt = attempt == self.MAX_ATTEMPTS - 1
+            try:
+                async with client.stream("POST", url, content=body, headers=headers) as response:
+                    if response.status_code not in self.RETRY_STATUS_CODES or is_last_attempt:
+                        if response.is_error:
+                            # Load the error body so _parse_error_response can inspect it
+                            await response.aread()
+                        response.raise_for_status()
+                        # The destination only accepts a whole buffer, so read the body in one go
+                        return await response.aread()
+                    delay = self._retry_delay(attempt, response)
+                    self._log(
+                        f"Got HTTP {response.status_code}; retrying in {delay:.1f}s "
+                        f"(attempt {attempt + 1}/{self.MAX_ATTEMPTS})"
+                    )
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                if is_last_attempt:
+                    raise
+                delay = self._retry_delay(attempt)
+                self._log(
+                    f"Connection failed: {e}; retrying in {delay:.1f}s (attempt {attempt + 1}/{self.MAX_ATTEMPTS})"
+                )
+            await asyncio.sleep(delay)
+
+        msg = f"{self.name}: text-to-speech request was not attempted."
+        raise RuntimeError(msg)
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Full-jitter exponential backoff, deferring to a numeric Retry-After on 429s."""
+        delay = random.uniform(0, min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2**attempt))
+        if response is not None and response.status_code == 429:
+            try:
+                delay = max(delay, float(response.headers.get("retry-after", "")))
+            except ValueError:
+                pass
+        return min(delay, self.RETRY_MAX_DELAY)
 
-        except Exception:
-            return f"API Error ({status_code}): Unable to parse error response"
+    def _parse_error_response(self, response_text: str, status_code: int) -> str:
+        """Parse error response and extract meaningful error information."""
+        if len(response_text) <= ERROR_CACHE_MAX_BODY_LENGTH:
+            return _parse_error_cached(status_code, response_text)
+        return _parse_error_cached.__wrapped__(status_code, response_text)
 
     def _log_request(self, payload: dict[str, Any]) -> None:
         """Log request payload with truncated text for readability."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         try:
-            sanitized_payload = payload.copy()
-            for key in ["text", "previous_text", "next_text"]:
-                if key in sanitized_payload:
-                    text_value = sanitized_payload[key]
-                    if isinstance(text_value, str) and len(text_value) > PROMPT_TRUNCATE_LENGTH:
-                        sanitized_payload[key] = text_value[:PROMPT_TRUNCATE_LENGTH] + "..."
-
-            self._log(f"Request payload: {_json.dumps(sanitized_payload, indent=2)}")
+            # Only copy the payload when one of the text fields actually needs truncating
+            truncated = {
+                key: value[:PROMPT_TRUNCATE_LENGTH] + "..."
+                for key in ("text", "previous_text", "next_text")
+                if isinstance(value := payload.get(key), str) and len(value) > PROMPT_TRUNCATE_LENGTH
+            }
+            sanitized_payload = {**payload, **truncated} if truncated else payload
+
+            if orjson is not None:
+                rendered = orjson.dumps(sanitized_payload, option=orjson.OPT_INDENT_2).decode()
+            else:
+                rendered = _json.dumps(sanitized_payload, indent=2)
+            self._log(f"Request payload: {rendered}")
         except Exception:
             pass
 
-    def _handle_response(self, response_bytes: bytes) -> None:
-        """Handle audio response from ElevenLabs API."""
+    async def _handle_response(self, responses: list[bytes]) -> None:
+        """Handle audio responses from ElevenLabs API, one per input text."""
         try:
             self._log("Processing audio bytes from API response")
-            saved = self._output_file.build_file(default_filename="eleven_tts.mp3").write_bytes(response_bytes)
-            self.parameter_output_values["audio"] = AudioUrlArtifact(value=saved.location, name=saved.location)
-            self._log(f"Saved audio to project storage as {saved.location}")
+            artifacts = []
+            for index, response_bytes in enumerate(responses):
+                # Batches number each clip through the {_index} macro variable so every clip gets its own
+                # path, even when the output situation overwrites existing files
+                extra_vars = {"_index": index} if len(responses) > 1 else {}
+                destination = self._output_file.build_file(default_filename="eleven_tts.mp3", **extra_vars)
+                # The write is synchronous file I/O, so keep it off the event loop
+                saved = await asyncio.to_thread(destination.write_bytes, response_bytes)
+                artifacts.append(AudioUrlArtifact(value=saved.location, name=saved.location))
+                self._log(f"Saved audio to project storage as {saved.location}")
+            self.parameter_output_values["audio"] = artifacts[0]
+            self.parameter_output_values["audio_list"] = artifacts
 
             # Note: Direct API doesn't provide alignment data in the same format as proxy
             # Set to None for now
@@ -691,10 +943,10 @@ class ElevenLabsTextToSpeech(SuccessFailureNode):
 
         except Exception as e:
             self._log(f"Failed to save audio from bytes: {e}")
-            self.parameter_output_values["audio"] = None
-            self.parameter_output_values["alignment"] = None
+            self._set_safe_defaults()
             raise
 
     def _set_safe_defaults(self) -> None:
         self.parameter_output_values["audio"] = None
+        self.parameter_output_values["audio_list"] = None
         self.parameter_output_values["alignment"] = None
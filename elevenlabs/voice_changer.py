@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib.util
 import json as _json
 import logging
-import subprocess
-import tempfile
-from contextlib import suppress
+import os
+import secrets
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing, suppress
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
+from elevenlabs_common import dumps_str, loads, request_bucket
 from griptape.artifacts.audio_url_artifact import AudioUrlArtifact
 from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMessage, ParameterMode
 from griptape_nodes.exe_types.node_types import SuccessFailureNode
@@ -19,31 +28,227 @@ from griptape_nodes.exe_types.param_types.parameter_string import ParameterStrin
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 from griptape_nodes.traits.button import Button
 from griptape_nodes.traits.options import Options
+from xdg_base_dirs import xdg_cache_home
 
 logger = logging.getLogger(__name__)
 
 
 PROMPT_TRUNCATE_LENGTH = 100
 
-# Voice preset mapping - friendly names to Eleven Labs voice IDs (sorted alphabetically)
-VOICE_PRESET_MAP = {  # spellchecker:disable-line
-    "Alexandra": "kdmDKE6EkgrWrrykO9Qt",  # spellchecker:disable-line
-    "Antoni": "ErXwobaYiN019PkySvjV",  # spellchecker:disable-line
-    "Austin": "Bj9UqZbhQsanLzgalpEG",  # spellchecker:disable-line
-    "Clyde": "2EiwWnXFnvU5JabPnv8n",  # spellchecker:disable-line
-    "Dave": "CYw3kZ02Hs0563khs1Fj",  # spellchecker:disable-line
-    "Domi": "AZnzlk1XvdvUeBnXmlld",  # spellchecker:disable-line
-    "Drew": "29vD33N1CtxCmqQRPOHJ",  # spellchecker:disable-line
-    "Fin": "D38z5RcWu1voky8WS1ja",  # spellchecker:disable-line
-    "Hope": "tnSpp4vdxKPjI9w0GnoV",  # spellchecker:disable-line
-    "James": "EkK5I93UQWFDigLMpZcX",  # spellchecker:disable-line
-    "Jane": "RILOU7YmBhvwJGDGjNmP",  # spellchecker:disable-line
-    "Paul": "5Q0t7uMcjvnagumLfvZi",  # spellchecker:disable-line
-    "Rachel": "21m00Tcm4TlvDq8ikWAM",  # spellchecker:disable-line
-    "Sarah": "EXAVITQu4vr4xnSDxMaL",  # spellchecker:disable-line
-    "Thomas": "GBv7mTt0atIp3Br8iCZE",  # spellchecker:disable-line
+# Stability choices -> voice_settings.stability values sent to the API
+STABILITY_MAP = {"Creative": 0.0, "Natural": 0.5, "Robust": 1.0}
+
+
+def _error_detail_message(response: httpx.Response) -> str:
+    """Return detail.message from an API error body, falling back to the raw body; the body is decoded once."""
+    body = response.content
+    try:
+        return loads(body)["detail"]["message"]
+    except Exception:
+        return body.decode("utf-8", "replace")
+
+
+# Keep-alive pool shared by the audio download and speech-to-speech upload, so re-running the node reuses warm
+# TLS connections instead of handshaking per call
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+# Timeouts in one place: uploads and downloads of long audio may take minutes, but connecting or waiting for a
+# pooled connection should not; preview lookups are small and interactive
+_API_TIMEOUT = httpx.Timeout(connect=10.0, read=300.0, write=300.0, pool=10.0)
+_PREVIEW_TIMEOUT = httpx.Timeout(10.0)
+
+# Lets concurrent uploads and preview lookups multiplex over one connection; only negotiated when the optional
+# h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Async clients are bound to the event loop they first connect on, so keep one per loop
+_http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=_API_TIMEOUT, limits=_HTTP_LIMITS, http2=_HTTP2_AVAILABLE)
+        _http_clients[loop] = client
+    return client
+
+
+# Voice preview lookups keyed by (api_key, voice_id) -> (monotonic expiry, preview_url, error message).
+# Preview URLs are effectively static per voice, so flipping back to a voice already seen needs no request.
+_preview_cache: OrderedDict[tuple[str, str], tuple[float, str | None, str | None]] = OrderedDict()
+
+# Validators and bodies of voice metadata GETs keyed by (api_key, url) -> (etag, last_modified, body, headers),
+# so a refetch can be answered with an empty 304. Only the GET lookups go through here, never the POSTs.
+_conditional_get_cache: OrderedDict[tuple[str, str], tuple[str | None, str | None, bytes, str | None]] = OrderedDict()
+CONDITIONAL_GET_CACHE_MAX_ENTRIES = 256
+
+
+async def _conditional_get(url: str, api_key: str) -> httpx.Response:
+    """GET url with If-None-Match/If-Modified-Since from an earlier response; a 304 replays the cached 200."""
+    cache_key = (api_key, url)
+    headers = {"xi-api-key": api_key}
+    cached = _conditional_get_cache.get(cache_key)
+    if cached is not None:
+        etag, last_modified, _, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    client = _get_http_client()
+    response = await client.get(url, headers=headers, timeout=_PREVIEW_TIMEOUT)
+
+    if response.status_code == 304:
+        if cached is not None:
+            _conditional_get_cache.move_to_end(cache_key)
+            # Only the decoded body and its type are kept, so the replay carries no stale transfer headers
+            # (Content-Encoding, Content-Length) that would make httpx decode the body a second time
+            replay_headers = {"content-type": cached[3]} if cached[3] else None
+            return httpx.Response(200, headers=replay_headers, content=cached[2], request=response.request)
+        # Nothing to replay; ask again without validators
+        response = await client.get(url, headers={"xi-api-key": api_key}, timeout=_PREVIEW_TIMEOUT)
+
+    if response.status_code == 200:
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            _conditional_get_cache[cache_key] = (
+                etag,
+                last_modified,
+                response.content,
+                response.headers.get("content-type"),
+            )
+            _conditional_get_cache.move_to_end(cache_key)
+            while len(_conditional_get_cache) > CONDITIONAL_GET_CACHE_MAX_ENTRIES:
+                _conditional_get_cache.popitem(last=False)
+        else:
+            _conditional_get_cache.pop(cache_key, None)
+    return response
+
+
+def _preview_disk_cache_path(api_key: str, voice_id: str) -> Path:
+    # Scoped per account without writing the key itself to disk; custom voice ids are hashed in too
+    digest = hashlib.sha256(f"{api_key}:{voice_id}".encode()).hexdigest()[:32]
+    return xdg_cache_home() / "griptape_nodes" / "elevenlabs" / f"voice_preview_{digest}.json"
+
+
+def _load_disk_preview(path: Path, ttl: float) -> tuple[str, float] | None:
+    """Return the cached preview URL and its remaining lifetime, if the entry on disk is younger than ttl."""
+    try:
+        entry = _json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    preview_url = entry.get("preview_url")
+    fetched_at = entry.get("fetched_at")
+    if not isinstance(preview_url, str) or not isinstance(fetched_at, (int, float)):
+        return None
+    remaining = ttl - (time.time() - fetched_at)
+    if remaining <= 0:
+        return None
+    return preview_url, remaining
+
+
+def _store_disk_preview(path: Path, preview_url: str) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(_json.dumps({"preview_url": preview_url, "fetched_at": time.time()}), encoding="utf-8")
+        # Atomic swap so a concurrent reader never sees a partial file
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.info("VoiceChanger could not write voice preview cache %s: %s", path, e)
+
+
+async def _iter_multipart(
+    boundary: str,
+    fields: dict[str, str],
+    file_field: str,
+    filename: str,
+    content_type: str,
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[bytes]:
+    """Encode a multipart/form-data body whose single file part is streamed from chunks."""
+    for name, value in fields.items():
+        yield f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+    yield (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+    async for chunk in chunks:
+        yield chunk
+    yield f"\r\n--{boundary}--\r\n".encode()
+
+
+# Source audio codecs that can be streamed to the API without re-encoding -> (pipe muxer, upload filename,
+# content type). MP4/MOV audio is usually AAC, which needs the ADTS muxer to be written to a pipe.
+_AUDIO_COPY_FORMATS: dict[str, tuple[str, str, str]] = {
+    "mp3": ("mp3", "audio.mp3", "audio/mpeg"),
+    "aac": ("adts", "audio.aac", "audio/aac"),
 }
 
+# Preview lookups currently on the wire, keyed like _preview_cache, so concurrent requests for the same voice
+# (rapid re-selection, several nodes, the prewarm) share a single GET
+_preview_inflight: dict[tuple[str, str], asyncio.Task[tuple[str | None, str | None]]] = {}
+
+# Background task that warms _preview_cache for every preset voice; started by the first node created inside a
+# running event loop and kept here so it is not garbage collected mid-flight
+_preview_prewarm_task: asyncio.Task | None = None
+
+# Voice preset mapping - friendly names to Eleven Labs voice IDs (sorted alphabetically)
+VOICE_PRESET_MAP = MappingProxyType(
+    {  # spellchecker:disable-line
+        "Alexandra": "kdmDKE6EkgrWrrykO9Qt",  # spellchecker:disable-line
+        "Antoni": "ErXwobaYiN019PkySvjV",  # spellchecker:disable-line
+        "Austin": "Bj9UqZbhQsanLzgalpEG",  # spellchecker:disable-line
+        "Clyde": "2EiwWnXFnvU5JabPnv8n",  # spellchecker:disable-line
+        "Dave": "CYw3kZ02Hs0563khs1Fj",  # spellchecker:disable-line
+        "Domi": "AZnzlk1XvdvUeBnXmlld",  # spellchecker:disable-line
+        "Drew": "29vD33N1CtxCmqQRPOHJ",  # spellchecker:disable-line
+        "Fin": "D38z5RcWu1voky8WS1ja",  # spellchecker:disable-line
+        "Hope": "tnSpp4vdxKPjI9w0GnoV",  # spellchecker:disable-line
+        "James": "EkK5I93UQWFDigLMpZcX",  # spellchecker:disable-line
+        "Jane": "RILOU7YmBhvwJGDGjNmP",  # spellchecker:disable-line
+        "Paul": "5Q0t7uMcjvnagumLfvZi",  # spellchecker:disable-line
+        "Rachel": "21m00Tcm4TlvDq8ikWAM",  # spellchecker:disable-line
+        "Sarah": "EXAVITQu4vr4xnSDxMaL",  # spellchecker:disable-line
+        "Thomas": "GBv7mTt0atIp3Br8iCZE",  # spellchecker:disable-line
+    }
+)
+
+# Dropdown order for the voice selector; Options stores the list it is given, so each node gets a copy
+VOICE_CHOICES = (*VOICE_PRESET_MAP, "Custom...")
+
+# Output formats offered by the speech-to-speech endpoint (codec_sample_rate_bitrate)
+OUTPUT_FORMAT_CHOICES = (
+    "mp3_22050_32",
+    "mp3_24000_48",
+    "mp3_44100_32",
+    "mp3_44100_64",
+    "mp3_44100_96",
+    "mp3_44100_128",
+    "mp3_44100_192",
+    "pcm_8000",
+    "pcm_16000",
+    "pcm_22050",
+    "pcm_24000",
+    "pcm_32000",
+    "pcm_44100",
+    "pcm_48000",
+    "ulaw_8000",
+    "alaw_8000",
+    "opus_48000_32",
+    "opus_48000_64",
+    "opus_48000_96",
+    "opus_48000_128",
+    "opus_48000_192",
+)
+
+# Speech-to-speech models
+MODEL_CHOICES = ("eleven_multilingual_sts_v2",)
+
 
 class ElevenLabsVoiceChanger(SuccessFailureNode):
     """Transform audio from one voice to another using Eleven Labs speech-to-speech API.
@@ -58,6 +263,23 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
     SERVICE_NAME = "ElevenLabs"
     API_KEY_NAME = "ELEVEN_LABS_API_KEY"
 
+    # Successful preview lookups are reused for an hour; rejected voice ids are retried after a minute
+    PREVIEW_CACHE_TTL = 3600.0
+    PREVIEW_ERROR_CACHE_TTL = 60.0
+    PREVIEW_CACHE_MAX_ENTRIES = 128
+    # Successful lookups are also persisted so previews survive restarts without a request
+    PREVIEW_DISK_CACHE_TTL = 24 * 3600.0
+
+    # Upper bound on a single FFmpeg audio extraction, in seconds, and the stdout read size while streaming it
+    FFMPEG_TIMEOUT = 300.0
+    FFMPEG_READ_SIZE = 64 * 1024
+    # Pipe buffering allowed before FFmpeg's output stops being read ahead of the upload
+    FFMPEG_PIPE_LIMIT = 1024 * 1024
+    FFPROBE_TIMEOUT = 30.0
+
+    # Read size when forwarding downloaded input audio into the upload
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.category = "ElevenLabs.Audio"
@@ -66,6 +288,12 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
         # ElevenLabs API base URL
         self._api_base = "https://api.elevenlabs.io/v1/"
 
+        # In-flight voice preview lookup, cancelled when the selection changes again
+        self._preview_task: asyncio.Task[None] | None = None
+        # Last voice selection acted on, so re-emitting an unchanged value doesn't redo the preview work
+        self._last_preset: str | None = None
+        self._last_custom_voice_id: str | None = None
+
         # INPUTS / PROPERTIES
         # Audio/Video input
 
@@ -94,28 +322,7 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
                 default_value="Alexandra",
                 tooltip="Select a preset voice or choose 'Custom...' to enter a voice ID",
                 allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
-                traits={
-                    Options(
-                        choices=[
-                            "Alexandra",
-                            "Antoni",
-                            "Austin",
-                            "Clyde",
-                            "Dave",
-                            "Domi",
-                            "Drew",
-                            "Fin",
-                            "Hope",
-                            "James",
-                            "Jane",
-                            "Paul",
-                            "Rachel",
-                            "Sarah",
-                            "Thomas",
-                            "Custom...",
-                        ]
-                    )
-                },
+                traits={Options(choices=list(VOICE_CHOICES))},
                 ui_options={"display_name": "Voice"},
             )
         )
@@ -176,7 +383,7 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
                 allow_input=True,
                 allow_property=True,
                 allow_output=False,
-                traits={Options(choices=["Creative", "Natural", "Robust"])},
+                traits={Options(choices=list(STABILITY_MAP))},
             )
             ParameterFloat(
                 name="similarity_boost",
@@ -199,7 +406,7 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
                 default_value="eleven_multilingual_sts_v2",
                 tooltip="Select the speech-to-speech model to use",
                 allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
-                traits={Options(choices=["eleven_multilingual_sts_v2"])},
+                traits={Options(choices=list(MODEL_CHOICES))},
                 ui_options={"display_name": "Model"},
             )
         )
@@ -237,33 +444,7 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
                 default_value="mp3_44100_128",
                 tooltip="Output format of the generated audio (codec_sample_rate_bitrate)",
                 allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
-                traits={
-                    Options(
-                        choices=[
-                            "mp3_22050_32",
-                            "mp3_24000_48",
-                            "mp3_44100_32",
-                            "mp3_44100_64",
-                            "mp3_44100_96",
-                            "mp3_44100_128",
-                            "mp3_44100_192",
-                            "pcm_8000",
-                            "pcm_16000",
-                            "pcm_22050",
-                            "pcm_24000",
-                            "pcm_32000",
-                            "pcm_44100",
-                            "pcm_48000",
-                            "ulaw_8000",
-                            "alaw_8000",
-                            "opus_48000_32",
-                            "opus_48000_64",
-                            "opus_48000_96",
-                            "opus_48000_128",
-                            "opus_48000_192",
-                        ]
-                    )
-                },
+                traits={Options(choices=list(OUTPUT_FORMAT_CHOICES))},
                 ui_options={"display_name": "Output Format"},
             )
         )
@@ -293,11 +474,16 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
         )
 
         # Fetch voice preview for the default voice on node creation
+        self._last_preset = self.get_parameter_value("voice_preset")
         self._fetch_voice_preview()
+        self._start_preview_prewarm()
 
     def after_value_set(self, parameter: Parameter, value: Any) -> None:
         """Update parameter visibility based on voice preset selection and fetch preview."""
-        if parameter.name == "voice_preset":
+        if parameter.name == "voice_preset" and value != self._last_preset:
+            self._last_preset = value
+            # The preview now shows another voice, so the custom ID must be acted on again when it is set
+            self._last_custom_voice_id = None
             if value == "Custom...":
                 self.show_parameter_by_name("custom_voice_id")
                 # Don't fetch preview yet - wait for custom_voice_id to be set
@@ -306,7 +492,8 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
                 # Fetch preview for the selected preset voice
                 self._fetch_voice_preview()
 
-        if parameter.name == "custom_voice_id":
+        if parameter.name == "custom_voice_id" and value != self._last_custom_voice_id:
+            self._last_custom_voice_id = value
             # Fetch preview when custom voice ID is set (only if voice_preset is "Custom...")
             voice_preset = self.get_parameter_value("voice_preset")
             if voice_preset == "Custom...":
@@ -335,9 +522,10 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
 
         return errors or None
 
-    def _log(self, message: str) -> None:
-        with suppress(Exception):
-            logger.info(message)
+    def _log(self, message: str, *args: Any) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            with suppress(Exception):
+                logger.info(message, *args)
 
     def process(self) -> None:
         pass
@@ -350,22 +538,20 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
         self._clear_execution_status()
 
         try:
-            # Get and prepare audio input
-            audio_url = await self._prepare_audio_input()
-            if not audio_url:
-                self._set_safe_defaults()
-                self._set_status_results(was_successful=False, result_details="Failed to prepare audio input")
-                return
-
             # Get parameters
             params = self._get_parameters()
             voice_id = params.pop("voice_id")
 
-            # Download audio file
-            audio_bytes = await self._download_audio(audio_url)
+            # Get and prepare audio input, streamed from the download or out of FFmpeg for video
+            prepared = await self._prepare_audio_input()
+            if not prepared:
+                self._set_safe_defaults()
+                self._set_status_results(was_successful=False, result_details="Failed to prepare audio input")
+                return
+            audio, filename, content_type = prepared
 
             # Submit request
-            response_bytes = await self._submit_request(voice_id, audio_bytes, params)
+            response_bytes = await self._submit_request(voice_id, audio, params, filename, content_type)
 
             if response_bytes:
                 self._handle_response(response_bytes)
@@ -382,8 +568,13 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
             self._set_status_results(was_successful=False, result_details=error_message)
             self._handle_failure_exception(e)
 
-    async def _prepare_audio_input(self) -> str | None:
-        """Prepare audio input, extracting from video if necessary."""
+    async def _prepare_audio_input(self) -> tuple[AsyncGenerator[bytes, None], str, str] | None:
+        """Prepare audio input, extracting from video if necessary.
+
+        Returns (chunks, upload filename, content type). The audio is a chunk iterator, fed from FFmpeg's stdout
+        for video or from the download for audio, so producing it overlaps with the upload instead of being
+        buffered whole first.
+        """
         audio_or_video = self.get_parameter_value("audio_or_video")
 
         if not audio_or_video:
@@ -396,12 +587,22 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
             if not video_url:
                 error_msg = f"{self.name} could not extract URL from video input"
                 raise ValueError(error_msg)
-            audio_url = await self._extract_audio_from_video(video_url)
-            return audio_url
+            ffmpeg_path, ffprobe_path = self._get_ffmpeg_paths()
+            # Audio that is already MP3 or AAC is remuxed as-is instead of being re-encoded
+            codec = await self._probe_audio_codec(ffprobe_path, video_url)
+            muxer, filename, content_type = _AUDIO_COPY_FORMATS.get(codec or "", (None, "audio.mp3", "audio/mpeg"))
+            if muxer is None:
+                codec_args = ["-acodec", "libmp3lame", "-b:a", "128k", "-f", "mp3"]
+            else:
+                self._log("Video audio is already %s; copying it without re-encoding", codec)
+                codec_args = ["-c:a", "copy", "-f", muxer]
+            return self._iter_audio_from_video(ffmpeg_path, video_url, codec_args), filename, content_type
 
         # It's already audio
         audio_url = self._extract_url_from_artifact(audio_or_video)
-        return audio_url
+        if not audio_url:
+            return None
+        return self._iter_audio_download(audio_url), "audio.mp3", "audio/mpeg"
 
     def _extract_url_from_artifact(self, artifact: Any) -> str | None:
         """Extract URL from artifact (audio or video)."""
@@ -415,8 +616,8 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
 
         return None
 
-    async def _extract_audio_from_video(self, video_url: str) -> str:
-        """Extract audio from video using FFmpeg."""
+    def _get_ffmpeg_paths(self) -> tuple[str, str]:
+        """Resolve the FFmpeg and ffprobe executables up front, so a missing install fails before any upload."""
         try:
             import static_ffmpeg.run  # type: ignore[import-untyped]
         except ImportError:
@@ -425,74 +626,114 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
 
         # Get FFmpeg path (returns tuple of ffmpeg_path, ffprobe_path)
         try:
-            ffmpeg_path, _ = static_ffmpeg.run.get_or_fetch_platform_executables_else_raise()
+            ffmpeg_path, ffprobe_path = static_ffmpeg.run.get_or_fetch_platform_executables_else_raise()
         except Exception as e:
             error_msg = f"FFmpeg not found. Please ensure static-ffmpeg is properly installed. Error: {e!s}"
             raise ValueError(error_msg) from e
-
-        # Create temporary output file
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-            temp_audio_path = Path(temp_file.name)
-
+        return ffmpeg_path, ffprobe_path
+
+    async def _probe_audio_codec(self, ffprobe_path: str, video_url: str) -> str | None:
+        """Return the codec name of the video's first audio stream, or None if it can't be determined."""
+        cmd = [
+            ffprobe_path,
+            "-v",
+            "error",
+            "-select_streams",
+            "a:0",
+            "-show_entries",
+            "stream=codec_name",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            video_url,
+        ]
         try:
-            # Build FFmpeg command to extract audio
-            cmd = [
-                ffmpeg_path,
-                "-i",
-                video_url,
-                "-vn",  # No video
-                "-acodec",
-                "libmp3lame",
-                "-b:a",
-                "128k",
-                "-y",  # Overwrite
-                str(temp_audio_path),
-            ]
-
-            # Run FFmpeg
-            subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=300)  # noqa: S603
-
-            if not temp_audio_path.exists() or temp_audio_path.stat().st_size == 0:
-                error_msg = "FFmpeg did not create output file or file is empty"
-                raise ValueError(error_msg)
-
-            # Read audio bytes and save to static storage
-            with temp_audio_path.open("rb") as f:
-                audio_bytes = f.read()
-
-            # Save to project file storage and return URL
-            saved = self._output_file.build_file(default_filename="extracted_audio.mp3").write_bytes(audio_bytes)
-
-            return saved.location
-
-        except subprocess.CalledProcessError as e:
-            error_msg = f"FFmpeg failed to extract audio: {e.stderr}"
-            raise ValueError(error_msg) from e
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=self.FFPROBE_TIMEOUT)
+            except TimeoutError:
+                proc.kill()
+                await proc.communicate()
+                raise
         except Exception as e:
-            error_msg = f"Failed to extract audio from video: {e}"
-            raise ValueError(error_msg) from e
+            # Probing is only an optimization; transcoding handles anything
+            self._log("Could not probe video audio codec, transcoding instead: %s", e)
+            return None
+        if proc.returncode != 0:
+            return None
+        return stdout.decode(errors="replace").strip() or None
+
+    async def _iter_audio_from_video(
+        self, ffmpeg_path: str, video_url: str, codec_args: list[str]
+    ) -> AsyncGenerator[bytes, None]:
+        """Extract audio from video using FFmpeg, yielding chunks as FFmpeg produces them."""
+        # Build FFmpeg command to extract audio, streaming it to stdout in the container codec_args selects
+        cmd = [
+            ffmpeg_path,
+            "-loglevel",
+            "error",  # Keep stderr to actual errors; it is only read once FFmpeg exits
+            "-i",
+            video_url,
+            "-vn",  # No video
+            *codec_args,
+            "pipe:1",
+        ]
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.FFMPEG_TIMEOUT
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, limit=self.FFMPEG_PIPE_LIMIT
+        )
+        stdout, stderr = proc.stdout, proc.stderr
+        if stdout is None or stderr is None:
+            error_msg = "Failed to extract audio from video: FFmpeg pipes are unavailable"
+            raise ValueError(error_msg)
+        # Drain stderr concurrently so FFmpeg never blocks on a full pipe
+        stderr_task = asyncio.ensure_future(stderr.read())
+        produced = False
+        try:
+            try:
+                while chunk := await asyncio.wait_for(stdout.read(self.FFMPEG_READ_SIZE), deadline - loop.time()):
+                    produced = True
+                    yield chunk
+                returncode = await asyncio.wait_for(proc.wait(), deadline - loop.time())
+            except TimeoutError as e:
+                error_msg = f"Failed to extract audio from video: FFmpeg timed out after {self.FFMPEG_TIMEOUT:.0f}s"
+                raise ValueError(error_msg) from e
         finally:
-            # Clean up temp file
-            if temp_audio_path.exists():
-                temp_audio_path.unlink()
+            # Also reached when the upload is aborted part way through; the unread output is drained so the
+            # killed process can be reaped
+            if proc.returncode is None:
+                stderr_task.cancel()
+                proc.kill()
+                await proc.communicate()
+
+        if returncode != 0:
+            error_msg = f"FFmpeg failed to extract audio: {(await stderr_task).decode(errors='replace')}"
+            raise ValueError(error_msg)
+        if not produced:
+            error_msg = "FFmpeg did not produce any audio output"
+            raise ValueError(error_msg)
 
-    async def _download_audio(self, audio_url: str) -> bytes:
-        """Download audio from URL."""
+    async def _iter_audio_download(self, audio_url: str) -> AsyncGenerator[bytes, None]:
+        """Download audio from URL, yielding chunks as they arrive so they can be forwarded to the upload."""
         try:
-            async with httpx.AsyncClient(timeout=300.0) as client:
-                response = await client.get(audio_url)
+            async with _get_http_client().stream("GET", audio_url) as response:
                 response.raise_for_status()
-                return response.content
+                async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                    yield chunk
         except Exception as e:
             error_msg = f"Failed to download audio from {audio_url}: {e}"
             raise ValueError(error_msg) from e
 
     def _get_parameters(self) -> dict[str, Any]:
         """Get parameters for the API request."""
-        voice_preset = self.get_parameter_value("voice_preset")
+        get_value = self.get_parameter_value
+        voice_preset = get_value("voice_preset")
         voice_id = None
         if voice_preset == "Custom...":
-            voice_id = self.get_parameter_value("custom_voice_id")
+            voice_id = get_value("custom_voice_id")
         elif voice_preset:
             voice_id = VOICE_PRESET_MAP.get(voice_preset)
 
@@ -500,12 +741,12 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
             error_msg = f"{self.name} requires a valid voice selection"
             raise ValueError(error_msg)
 
-        model_id = self.get_parameter_value("model_id") or "eleven_multilingual_sts_v2"
-        output_format = self.get_parameter_value("output_format") or "mp3_44100_128"
-        seed = self.get_parameter_value("seed")
-        remove_background_noise = self.get_parameter_value("remove_background_noise") or False
-        stability_str = self.get_parameter_value("stability")
-        similarity_boost = self.get_parameter_value("similarity_boost")
+        model_id = get_value("model_id") or "eleven_multilingual_sts_v2"
+        output_format = get_value("output_format") or "mp3_44100_128"
+        seed = get_value("seed")
+        remove_background_noise = get_value("remove_background_noise") or False
+        stability_str = get_value("stability")
+        similarity_boost = get_value("similarity_boost")
 
         params: dict[str, Any] = {
             "voice_id": voice_id,
@@ -523,22 +764,17 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
         # Build voice_settings
         voice_settings = {}
         if stability_str is not None:
-            match stability_str:
-                case "Creative":
-                    voice_settings["stability"] = 0.0
-                case "Natural":
-                    voice_settings["stability"] = 0.5
-                case "Robust":
-                    voice_settings["stability"] = 1.0
-                case _:
-                    msg = f"{self.name} received invalid stability value: {stability_str}. Must be one of: Creative, Natural, or Robust"
-                    raise ValueError(msg)
+            stability = STABILITY_MAP.get(stability_str)
+            if stability is None:
+                msg = f"{self.name} received invalid stability value: {stability_str}. Must be one of: Creative, Natural, or Robust"
+                raise ValueError(msg)
+            voice_settings["stability"] = stability
 
         if similarity_boost is not None:
             voice_settings["similarity_boost"] = similarity_boost
 
         if voice_settings:
-            params["voice_settings"] = _json.dumps(voice_settings)
+            params["voice_settings"] = dumps_str(voice_settings)
 
         return params
 
@@ -567,7 +803,212 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
 
         return None
 
+    def _show_voice_preview(self, preview_url: str) -> None:
+        self.set_parameter_value("voice_preview", AudioUrlArtifact(value=preview_url), emit_change=True)
+        self.error_message.value = ""
+        self.hide_message_by_name("error_message")
+
+    def _show_voice_preview_error(self, error_message: str) -> None:
+        self.error_message.value = error_message
+        self.show_message_by_name("error_message")
+        self.set_parameter_value("voice_preview", None, emit_change=False)
+
+    def _cache_voice_preview(
+        self,
+        cache_key: tuple[str, str],
+        preview_url: str | None,
+        error_message: str | None = None,
+        max_ttl: float | None = None,
+    ) -> None:
+        ttl = self.PREVIEW_CACHE_TTL if preview_url else self.PREVIEW_ERROR_CACHE_TTL
+        if max_ttl is not None:
+            ttl = min(ttl, max_ttl)
+        _preview_cache[cache_key] = (time.monotonic() + ttl, preview_url, error_message)
+        _preview_cache.move_to_end(cache_key)
+        while len(_preview_cache) > self.PREVIEW_CACHE_MAX_ENTRIES:
+            _preview_cache.popitem(last=False)
+
+    async def _cached_voice_preview_from_disk(self, cache_key: tuple[str, str]) -> str | None:
+        """Promote a persisted preview URL into the in-memory cache, if one is still fresh.
+
+        Only meant for a cold start, when memory holds no entry for the voice. The promoted entry expires no
+        later than the one on disk, so an aged disk entry isn't handed a fresh in-memory lifetime.
+        """
+        path = _preview_disk_cache_path(*cache_key)
+        entry = await asyncio.to_thread(_load_disk_preview, path, self.PREVIEW_DISK_CACHE_TTL)
+        if entry is None:
+            return None
+        preview_url, remaining = entry
+        self._cache_voice_preview(cache_key, preview_url, max_ttl=remaining)
+        return preview_url
+
     def _fetch_voice_preview(self) -> None:
+        """Resolve the voice preview in the background when an event loop is running.
+
+        A lookup still in flight for a previously selected voice is cancelled.
+        """
+        if self._preview_task is not None and not self._preview_task.done():
+            self._preview_task.cancel()
+        self._preview_task = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._fetch_voice_preview_once())
+            return
+        self._preview_task = loop.create_task(self._fetch_voice_preview_async())
+
+    def _start_preview_prewarm(self) -> None:
+        """Warm the preview cache for all preset voices, once per process, when an event loop is running."""
+        global _preview_prewarm_task  # noqa: PLW0603
+        if _preview_prewarm_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        api_key = GriptapeNodes.SecretsManager().get_secret(self.API_KEY_NAME)
+        if not api_key:
+            return
+        _preview_prewarm_task = loop.create_task(self._prewarm_preview_cache(api_key))
+
+    async def _prewarm_preview_cache(self, api_key: str) -> None:
+        """Fetch preview URLs for all preset voices so switching presets hits the cache.
+
+        One GET /voices covers the presets already in the account's voice list; any it doesn't include are
+        looked up individually, concurrently.
+        """
+        try:
+            await self._prewarm_from_voice_list(api_key)
+        except Exception as e:
+            self._log("Voice preview prewarm: listing voices failed, looking presets up individually: %s", e)
+
+        async def fetch(voice_id: str) -> None:
+            cache_key = (api_key, voice_id)
+            if cache_key in _preview_cache or await self._cached_voice_preview_from_disk(cache_key):
+                return
+            await self._lookup_voice_preview_coalesced(api_key, voice_id)
+
+        results = await asyncio.gather(
+            *(fetch(voice_id) for voice_id in VOICE_PRESET_MAP.values()), return_exceptions=True
+        )
+        failures = sum(isinstance(result, BaseException) for result in results)
+        if failures:
+            self._log("Voice preview prewarm: %s of %s lookups failed", failures, len(results))
+
+    async def _prewarm_from_voice_list(self, api_key: str) -> None:
+        preset_ids = set()
+        for voice_id in VOICE_PRESET_MAP.values():
+            cache_key = (api_key, voice_id)
+            if cache_key not in _preview_cache and not await self._cached_voice_preview_from_disk(cache_key):
+                preset_ids.add(voice_id)
+        if not preset_ids:
+            return
+        response = await _conditional_get(urljoin(self._api_base, "voices"), api_key)
+        response.raise_for_status()
+        fetched = []
+        for voice in loads(response.content).get("voices") or []:
+            voice_id = voice.get("voice_id")
+            preview_url = voice.get("preview_url")
+            if voice_id in preset_ids and preview_url:
+                cache_key = (api_key, voice_id)
+                self._cache_voice_preview(cache_key, str(preview_url))
+                fetched.append((_preview_disk_cache_path(*cache_key), str(preview_url)))
+
+        def store_all() -> None:
+            for path, preview_url in fetched:
+                _store_disk_preview(path, preview_url)
+
+        if fetched:
+            await asyncio.to_thread(store_all)
+
+    async def _fetch_voice_preview_once(self) -> None:
+        # The loop is discarded afterwards, so close the client it pooled instead of leaking its sockets
+        try:
+            await self._fetch_voice_preview_async()
+        finally:
+            client = _http_clients.pop(asyncio.get_running_loop(), None)
+            if client is not None:
+                await client.aclose()
+
+    async def _lookup_voice_preview_coalesced(self, api_key: str, voice_id: str) -> tuple[str | None, str | None]:
+        """Look up a voice preview, sharing one request between all callers asking for the same voice at once."""
+        loop = asyncio.get_running_loop()
+        cache_key = (api_key, voice_id)
+        task = _preview_inflight.get(cache_key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._lookup_voice_preview(api_key, voice_id))
+            _preview_inflight[cache_key] = task
+
+            def _forget(done: asyncio.Task[tuple[str | None, str | None]]) -> None:
+                if _preview_inflight.get(cache_key) is done:
+                    del _preview_inflight[cache_key]
+
+            task.add_done_callback(_forget)
+        # Shielded so a caller cancelled by a newer selection doesn't abort the lookup for the others
+        return await asyncio.shield(task)
+
+    async def _lookup_voice_preview(self, api_key: str, voice_id: str) -> tuple[str | None, str | None]:
+        """Request the voice's preview URL and cache the outcome.
+
+        Returns (preview_url, None) on success, or (None, error message) for the failures that are cached.
+        Other HTTP errors raise.
+        """
+        cache_key = (api_key, voice_id)
+
+        self._log("Fetching voice preview for voice_id: %s", voice_id)
+
+        # Try direct voice endpoint first
+        url = urljoin(self._api_base, f"voices/{voice_id}")
+
+        response = await _conditional_get(url, api_key)
+
+        # Handle specific error cases with detailed error messages
+        if response.status_code == 400:
+            error_msg = _error_detail_message(response)
+            self._log("Voice ID '%s' error (400 Bad Request): %s", voice_id, error_msg)
+            error_message = (
+                f"Voice '{voice_id}' is not accessible. \n\n"
+                "To use voices from the Voice Library, you must first add them to 'My Voices' "
+                "at https://elevenlabs.io/app/voice-library. "
+                "Once added to your account, the voice preview will be available."
+            )
+            self._cache_voice_preview(cache_key, None, error_message)
+            return None, error_message
+        if response.status_code == 404:
+            self._log("Voice ID '%s' not found (404 Not Found)", voice_id)
+            error_message = (
+                f"Voice '{voice_id}' not found in your account. "
+                "To use voices from the Voice Library, you must first add them to 'My Voices' "
+                "at https://elevenlabs.io/app/voice-library. "
+                "Once added to your account, the voice preview will be available."
+            )
+            self._cache_voice_preview(cache_key, None, error_message)
+            return None, error_message
+        if response.status_code == 401:
+            self._log("Unauthorized - API key may be invalid or voice is private")
+            error_message = (
+                "Unauthorized access. The API key may be invalid, or the voice is private. "
+                "To use voices from the Voice Library, you must first add them to 'My Voices' "
+                "at https://elevenlabs.io/app/voice-library."
+            )
+            self._cache_voice_preview(cache_key, None, error_message)
+            return None, error_message
+
+        response.raise_for_status()
+        voice_data = loads(response.content)
+
+        preview_url = voice_data.get("preview_url")
+        if not preview_url:
+            self._log("Voice data does not contain preview_url")
+            self._cache_voice_preview(cache_key, None, "Voice data does not contain preview_url")
+            return None, "Voice data does not contain preview_url"
+
+        self._cache_voice_preview(cache_key, str(preview_url))
+        await asyncio.to_thread(_store_disk_preview, _preview_disk_cache_path(*cache_key), str(preview_url))
+        self._log("Successfully fetched voice preview: %s", preview_url)
+        return str(preview_url), None
+
+    async def _fetch_voice_preview_async(self) -> None:
         """Fetch and set the preview URL for the selected voice."""
         voice_id = self._get_voice_id()
         if not voice_id:
@@ -585,102 +1026,56 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
                 self.show_message_by_name("error_message")
                 return
 
-            headers = {"xi-api-key": api_key}
-
-            self._log(f"Fetching voice preview for voice_id: {voice_id}")
-
-            # Try direct voice endpoint first
-            url = urljoin(self._api_base, f"voices/{voice_id}")
-
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url, headers=headers)
-
-                # Handle specific error cases with detailed error messages
-                if response.status_code == 400:
-                    error_text = response.text
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get("detail", {}).get("message", error_text)
-                    except Exception:
-                        error_msg = error_text
-                    self._log(f"Voice ID '{voice_id}' error (400 Bad Request): {error_msg}")
-                    error_message = (
-                        f"Voice '{voice_id}' is not accessible. \n\n"
-                        "To use voices from the Voice Library, you must first add them to 'My Voices' "
-                        "at https://elevenlabs.io/app/voice-library. "
-                        "Once added to your account, the voice preview will be available."
-                    )
-                    self.error_message.value = error_message
-                    self.show_message_by_name("error_message")
-                    self.set_parameter_value("voice_preview", None, emit_change=False)
+            cache_key = (api_key, voice_id)
+            cached = _preview_cache.get(cache_key)
+            if cached is not None:
+                expires_at, preview_url, error_message = cached
+                if time.monotonic() < expires_at:
+                    if preview_url:
+                        self._show_voice_preview(preview_url)
+                    else:
+                        self._show_voice_preview_error(error_message or "")
                     return
-                if response.status_code == 404:
-                    self._log(f"Voice ID '{voice_id}' not found (404 Not Found)")
-                    error_message = (
-                        f"Voice '{voice_id}' not found in your account. "
-                        "To use voices from the Voice Library, you must first add them to 'My Voices' "
-                        "at https://elevenlabs.io/app/voice-library. "
-                        "Once added to your account, the voice preview will be available."
-                    )
-                    self.error_message.value = error_message
-                    self.show_message_by_name("error_message")
-                    self.set_parameter_value("voice_preview", None, emit_change=False)
-                    return
-                if response.status_code == 401:
-                    self._log("Unauthorized - API key may be invalid or voice is private")
-                    error_message = (
-                        "Unauthorized access. The API key may be invalid, or the voice is private. "
-                        "To use voices from the Voice Library, you must first add them to 'My Voices' "
-                        "at https://elevenlabs.io/app/voice-library."
-                    )
-                    self.error_message.value = error_message
-                    self.show_message_by_name("error_message")
-                    self.set_parameter_value("voice_preview", None, emit_change=False)
+                # Expired in memory: the disk copy is no fresher, so go straight to the API
+                del _preview_cache[cache_key]
+            else:
+                # Cold start: a preview persisted by an earlier session can still answer without a request
+                preview_url = await self._cached_voice_preview_from_disk(cache_key)
+                if preview_url:
+                    self._show_voice_preview(preview_url)
                     return
 
-                response.raise_for_status()
-                voice_data = response.json()
-
-                preview_url = voice_data.get("preview_url")
-                if preview_url:
-                    preview_artifact = AudioUrlArtifact(value=str(preview_url))
-                    self.set_parameter_value("voice_preview", preview_artifact, emit_change=True)
-                    self.error_message.value = ""
-                    self.hide_message_by_name("error_message")
-                    self._log(f"Successfully fetched voice preview: {preview_url}")
-                else:
-                    self._log("Voice data does not contain preview_url")
-                    self.set_parameter_value("voice_preview", None, emit_change=False)
-                    self.error_message.value = "Voice data does not contain preview_url"
-                    self.show_message_by_name("error_message")
+            preview_url, error_message = await self._lookup_voice_preview_coalesced(api_key, voice_id)
+            if preview_url:
+                self._show_voice_preview(preview_url)
+            else:
+                self._show_voice_preview_error(error_message or "")
         except httpx.HTTPStatusError as e:
-            error_text = e.response.text
-            try:
-                error_data = e.response.json()
-                error_msg = error_data.get("detail", {}).get("message", error_text)
-            except Exception:
-                error_msg = error_text
-            self._log(f"HTTP error fetching voice preview ({e.response.status_code}): {error_msg}")
+            error_msg = _error_detail_message(e.response)
+            self._log("HTTP error fetching voice preview (%s): %s", e.response.status_code, error_msg)
             error_message = (
                 f"Failed to fetch voice preview (HTTP {e.response.status_code}): {error_msg}. "
                 "To use voices from the Voice Library, you must first add them to 'My Voices' "
                 "at https://elevenlabs.io/app/voice-library."
             )
-            self.error_message.value = error_message
-            self.show_message_by_name("error_message")
-            self.set_parameter_value("voice_preview", None, emit_change=False)
+            self._show_voice_preview_error(error_message)
         except Exception as e:
-            self._log(f"Failed to fetch voice preview: {e}")
+            self._log("Failed to fetch voice preview: %s", e)
             error_message = (
                 f"Failed to fetch voice preview: {e}. "
                 "To use voices from the Voice Library, you must first add them to 'My Voices' "
                 "at https://elevenlabs.io/app/voice-library."
             )
-            self.error_message.value = error_message
-            self.show_message_by_name("error_message")
-            self.set_parameter_value("voice_preview", None, emit_change=False)
-
-    async def _submit_request(self, voice_id: str, audio_bytes: bytes, params: dict[str, Any]) -> bytes | None:
+            self._show_voice_preview_error(error_message)
+
+    async def _submit_request(
+        self,
+        voice_id: str,
+        audio: AsyncGenerator[bytes, None],
+        params: dict[str, Any],
+        filename: str = "audio.mp3",
+        content_type: str = "audio/mpeg",
+    ) -> bytes | None:
         """Submit request to ElevenLabs speech-to-speech API (direct API, not proxy)."""
         api_key = self._get_api_key()
         url = urljoin(self._api_base, f"speech-to-speech/{voice_id}")
@@ -690,9 +1085,6 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
         if "output_format" in params:
             query_params["output_format"] = params.pop("output_format")
 
-        # Build multipart form data (as per ElevenLabs API docs)
-        files = {"audio": ("audio.mp3", audio_bytes, "audio/mpeg")}
-
         form_data: dict[str, Any] = {}
         if "model_id" in params:
             form_data["model_id"] = params.pop("model_id")
@@ -706,24 +1098,29 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
 
         headers = {"xi-api-key": api_key}
 
-        self._log(f"Submitting request to ElevenLabs speech-to-speech API with voice: {voice_id}")
+        self._log("Submitting request to ElevenLabs speech-to-speech API with voice: %s", voice_id)
 
+        await request_bucket.acquire()
         try:
-            async with httpx.AsyncClient(timeout=300.0) as client:
-                response = await client.post(
+            # Build multipart form data (as per ElevenLabs API docs). httpx only encodes multipart from in-memory
+            # or sync file data, so the body is streamed by hand; closing the source on the way out also stops
+            # FFmpeg or the download if the upload fails part way
+            boundary = secrets.token_hex(16)
+            async with aclosing(audio):
+                response = await _get_http_client().post(
                     url,
                     params=query_params,
-                    files=files,
-                    data=form_data,
-                    headers=headers,
+                    content=_iter_multipart(boundary, form_data, "audio", filename, content_type, audio),
+                    headers={**headers, "Content-Type": f"multipart/form-data; boundary={boundary}"},
                 )
-                response.raise_for_status()
+            self._log("Speech-to-speech response received over %s", response.http_version)
+            response.raise_for_status()
         except httpx.HTTPStatusError as e:
-            self._log(f"HTTP error: {e.response.status_code} - {e.response.text}")
+            self._log("HTTP error: %s - %s", e.response.status_code, e.response.text)
             error_message = self._parse_error_response(e.response.text, e.response.status_code)
             raise RuntimeError(error_message) from e
         except Exception as e:
-            self._log(f"Request failed: {e}")
+            self._log("Request failed: %s", e)
             msg = f"Request failed: {e}"
             raise RuntimeError(msg) from e
 
@@ -733,7 +1130,7 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
     def _parse_error_response(self, response_text: str, status_code: int) -> str:
         """Parse error response and extract meaningful error information for the user."""
         try:
-            error_data = _json.loads(response_text)
+            error_data = loads(response_text)
 
             if "detail" in error_data:
                 detail = error_data["detail"]
@@ -751,7 +1148,7 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
 
             return f"API Error ({status_code}): {response_text[:200]}"
 
-        except (_json.JSONDecodeError, KeyError, TypeError):
+        except (ValueError, KeyError, TypeError):  # JSON decode errors from either parser are ValueErrors
             return f"API Error ({status_code}): Unable to parse error response"
 
     def _handle_response(self, response_bytes: bytes) -> None:
@@ -759,7 +1156,7 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
         try:
             self._save_audio_from_bytes(response_bytes)
         except Exception as e:
-            self._log(f"Failed to process response: {e}")
+            self._log("Failed to process response: %s", e)
             self.parameter_output_values["audio_url"] = None
             raise
 
@@ -768,9 +1165,9 @@ class ElevenLabsVoiceChanger(SuccessFailureNode):
         try:
             saved = self._output_file.build_file(default_filename="eleven_voice_changer.mp3").write_bytes(audio_bytes)
             self.parameter_output_values["audio_url"] = AudioUrlArtifact(value=saved.location, name=saved.location)
-            self._log(f"Saved transformed audio to project storage as {saved.location}")
+            self._log("Saved transformed audio to project storage as %s", saved.location)
         except Exception as e:
-            self._log(f"Failed to save audio from bytes: {e}")
+            self._log("Failed to save audio from bytes: %s", e)
             self.parameter_output_values["audio_url"] = None
             raise
 
@@ -1,21 +1,176 @@
 from __future__ import annotations
 
-import base64
+import binascii
+import functools
+import hashlib
+import importlib.util
+import json
 import logging
 import os
+import re
+import time
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
 import httpx
+from elevenlabs_common import dumps, loads, request_bucket
 from griptape.artifacts.audio_url_artifact import AudioUrlArtifact
 from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
 from griptape_nodes.exe_types.node_types import DataNode
 from griptape_nodes.exe_types.param_components.project_file_parameter import ProjectFileParameter
+from xdg_base_dirs import xdg_cache_home
 
 # Note: dict_to_audio_url_artifact is imported lazily in _run() to avoid hard dependency
 # on griptape_nodes_library at import time
 
+# Pooled across runs and shared by the SDK clients below and the direct HTTP fallback, so design nodes
+# running side by side on the engine's worker threads reuse keep-alive connections to the ElevenLabs API.
+# The read timeout matches the SDK's own default, as generations can take well over 30s. Concurrent design
+# calls multiplex over one connection when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_http_client = httpx.Client(
+    http2=_HTTP2_AVAILABLE,
+    timeout=httpx.Timeout(240.0, connect=10.0),
+    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0),
+)
+_sdk_clients: dict[str, Any] = {}
+
+
+def _get_client(api_key: str) -> Any:
+    # One SDK client per key so repeated runs skip client setup and share the pooled transport
+    client = _sdk_clients.get(api_key)
+    if client is None:
+        from elevenlabs import ElevenLabs  # type: ignore
+
+        try:
+            client = ElevenLabs(api_key=api_key, httpx_client=_http_client)
+        except TypeError:
+            # Older SDK releases don't accept a custom transport
+            client = ElevenLabs(api_key=api_key)
+        client = _sdk_clients.setdefault(api_key, client)
+    return client
+
+
+# Design responses are deterministic once a seed is set, so seeded reruns are served from disk instead of
+# paying for another generation. ELEVEN_CACHE_MODE picks the policy: "enabled" (read and write, default),
+# "replay" (read only; a miss is an error rather than an API call), "write-only" or "disabled".
+DESIGN_CACHE_MODE_ENV_VAR = "ELEVEN_CACHE_MODE"
+DESIGN_CACHE_MODES = ("enabled", "replay", "write-only", "disabled")
+# Generated voice ids are only kept by ElevenLabs for a while, so cached designs expire too
+DESIGN_CACHE_TTL = 24 * 3600
+# Each entry holds several MB of base64 audio, so the directory is pruned to the newest entries on every write
+DESIGN_CACHE_MAX_ENTRIES = 64
+
+logger = logging.getLogger("griptape_nodes")
+
+# File extension for a saved preview: from its media type when recognised, else from the requested output_format
+_EXT_BY_MIME = {
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/wav": "wav",
+    "audio/x-wav": "wav",
+    "audio/wave": "wav",
+    "audio/ogg": "ogg",
+}
+_EXT_BY_FORMAT_PREFIX = {"mp3": "mp3", "pcm": "wav", "wav": "wav", "ogg": "ogg"}
+
+# Bare (headerless) base64 accepted for reference_audio, checked once whitespace is removed
+_B64_RE = re.compile(r"[A-Za-z0-9+/]+={0,2}")
+
+
+def _to_ascii(s: str | None) -> str | None:
+    """Coerce text to ASCII-only to satisfy strict header encoders in some envs."""
+    if s is None:
+        return None
+    # Nearly every key and prompt is plain ASCII already; skip the NFKD pass for those
+    if s.isascii():
+        return s
+    try:
+        return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+    except Exception:
+        try:
+            return s.encode("ascii", "ignore").decode("ascii")
+        except Exception:
+            return s
+
+
+# For the short, repeated strings (API key, header names and values); prompts go through _to_ascii uncached
+_to_ascii_cached = functools.lru_cache(maxsize=128)(_to_ascii)
+
+
+def _design_cache_mode() -> str:
+    mode = (os.environ.get(DESIGN_CACHE_MODE_ENV_VAR) or "enabled").strip().lower()
+    return mode if mode in DESIGN_CACHE_MODES else "enabled"
+
+
+def _design_cache_path(api_key: str, request: dict[str, Any]) -> Path:
+    # Scoped per account without writing the key itself to disk
+    blob = json.dumps({"api_key": api_key, **request}, sort_keys=True, default=str)
+    digest = hashlib.sha256(blob.encode("utf-8")).hexdigest()
+    return xdg_cache_home() / "griptape_nodes" / "elevenlabs" / f"voice_design_{digest}.json"
+
+
+def _load_disk_design(path: Path, ttl: float) -> dict[str, Any] | None:
+    """Return the cached design response if the entry on disk is younger than ttl."""
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            path.unlink(missing_ok=True)
+            return None
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("previews"), list):
+        return None
+    return entry
+
+
+def _store_disk_design(path: Path, previews_list: Any, used_text: str | None) -> None:
+    previews = []
+    for p in previews_list or []:
+        field = dict.get if isinstance(p, dict) else getattr
+        previews.append(
+            {
+                "generated_voice_id": field(p, "generated_voice_id", None),
+                "media_type": field(p, "media_type", None),
+                "duration_secs": field(p, "duration_secs", None),
+                "audio_base_64": field(p, "audio_base_64", None) or field(p, "audio_base64", None),
+            }
+        )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"text": used_text, "previews": previews}), encoding="utf-8")
+        # Atomic swap so a concurrent reader never sees a partial file
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.info("DesignVoice could not write design cache %s: %s", path, e)
+        return
+    _prune_disk_designs(path.parent, DESIGN_CACHE_TTL, DESIGN_CACHE_MAX_ENTRIES)
+
+
+def _prune_disk_designs(cache_dir: Path, ttl: float, max_entries: int) -> None:
+    """Delete design cache entries older than ttl, then all but the newest max_entries."""
+    entries = []
+    now = time.time()
+    for entry_path in cache_dir.glob("voice_design_*.json"):
+        try:
+            mtime = entry_path.stat().st_mtime
+            if now - mtime >= ttl:
+                entry_path.unlink(missing_ok=True)
+                continue
+        except OSError:
+            continue
+        entries.append((mtime, entry_path))
+    entries.sort(reverse=True)
+    for _, entry_path in entries[max_entries:]:
+        try:
+            entry_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
 
 class ElevenLabsDesignVoice(DataNode):
     """Design a voice from a descriptive prompt using ElevenLabs and return playable previews.
@@ -220,13 +375,12 @@ class ElevenLabsDesignVoice(DataNode):
         if isinstance(ref, str):
             if ref.startswith("data:audio") and "," in ref:
                 return ref.split(",", 1)[1]
-            # If it's already base64 without header, make a best-effort validation
-            try:
-                # Validate base64 (ignore whitespace)
-                base64.b64decode(ref, validate=True)
-                return ref
-            except Exception:
-                return None
+            # If it's already base64 without header, make a best-effort validation (ignore whitespace).
+            # A single regex scan, rather than decoding the whole clip just to throw the bytes away
+            stripped = "".join(ref.split())
+            if len(stripped) % 4 == 0 and _B64_RE.fullmatch(stripped):
+                return stripped
+            return None
         # If dict artifact-like with uri/url
         if isinstance(ref, dict):
             uri = ref.get("uri") or ref.get("url")
@@ -234,6 +388,81 @@ class ElevenLabsDesignVoice(DataNode):
                 return uri.split(",", 1)[1]
         return None
 
+    def _handle_preview(self, i: int, p: Any, used_text: str | None, output_format: str) -> tuple[dict[str, Any], Any]:
+        """Save one design preview and return (metadata entry, AudioUrlArtifact or None)."""
+        # Support both SDK object and dict
+        field = dict.get if isinstance(p, dict) else getattr
+        audio_b64 = field(p, "audio_base_64", None) or field(p, "audio_base64", None)
+        gen_id = field(p, "generated_voice_id", None)
+        media_type = field(p, "media_type", None) or "audio/mpeg"
+        duration = field(p, "duration_secs", None)
+
+        # Per-preview logging (truncated)
+        try:
+            self._logger.info(
+                "Preview[%s]: has_b64=%s b64_len=%s gen_id=%s media_type=%s duration=%s",
+                i,
+                bool(audio_b64),
+                len(audio_b64) if isinstance(audio_b64, str) else None,
+                gen_id,
+                media_type,
+                duration,
+            )
+            if isinstance(audio_b64, str) and self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Preview[%s] b64_head=%s", i, audio_b64[:60])
+        except Exception:
+            pass
+
+        audio_url = None
+        audio_artifact = None
+        if audio_b64:
+            # Prefer saving to static files for reliable playback
+            mime = media_type if isinstance(media_type, str) else "audio/mpeg"
+            ext = _EXT_BY_MIME.get(mime.split(";", 1)[0].strip().lower()) or _EXT_BY_FORMAT_PREFIX.get(
+                output_format.split("_", 1)[0], "mp3"
+            )
+            try:
+                file_stub = gen_id or f"preview_{i + 1}_{uuid4().hex[:8]}"
+                # Decoded inline so the bytes are released as soon as the write returns
+                saved = self._output_file.build_file(default_filename=f"elevenlabs_{file_stub}.{ext}").write_bytes(
+                    binascii.a2b_base64(audio_b64)
+                )
+                audio_artifact = AudioUrlArtifact(value=saved.location)
+                audio_url = saved.location
+            except Exception as e_save:
+                # Fallbacks: data URL path
+                try:
+                    data_url = f"data:{mime};base64,{audio_b64}"
+                    audio_artifact = AudioUrlArtifact(value=data_url)
+                    audio_url = data_url
+                    self._logger.info("Static save failed; used data URL for preview %s: %s", i, e_save)
+                except Exception as e_art2:
+                    # Last resort: try helper with 'url' key; else leave raw info
+                    try:
+                        from griptape_nodes_library.utils.audio_utils import (
+                            dict_to_audio_url_artifact,  # type: ignore
+                        )
+
+                        audio_dict = {"url": data_url}
+                        audio_artifact = dict_to_audio_url_artifact(audio_dict)
+                        audio_url = data_url
+                    except Exception:
+                        self._logger.info("All conversions failed for preview %s: %s", i, e_art2)
+
+        # Release this preview's base64 once it is saved rather than holding it until every preview is done
+        if isinstance(p, dict):
+            p.pop("audio_base_64", None)
+            p.pop("audio_base64", None)
+
+        preview_entry = {
+            "generated_voice_id": gen_id,
+            "media_type": media_type,
+            "duration_secs": duration,
+            "text": used_text,
+            "audio_url": audio_url,
+        }
+        return preview_entry, audio_artifact
+
     def process(self) -> Any:
         # Resolve API key before scheduling to avoid context issues
         # Try primary key from system config
@@ -248,18 +477,6 @@ class ElevenLabsDesignVoice(DataNode):
         yield lambda: self._run()
 
     def _run(self):
-        # Local helper: coerce text to ASCII-only to satisfy strict header encoders in some envs
-        def _to_ascii(s: str | None) -> str | None:
-            if s is None:
-                return None
-            try:
-                return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
-            except Exception:
-                try:
-                    return s.encode("ascii", "ignore").decode("ascii")
-                except Exception:
-                    return s
-
         # Validate inputs
         # Use the 'prompt' parameter for voice_description
         description: str | None = self.get_parameter_value("prompt")
@@ -324,26 +541,16 @@ class ElevenLabsDesignVoice(DataNode):
             self.parameter_output_values["preview_audios"] = []
             raise RuntimeError("Missing ELEVEN_LABS_API_KEY. Set it in system config or environment.")
 
+        # Ensure API key is ASCII-only to avoid header encoding issues in some envs
+        api_key_ascii = _to_ascii_cached(api_key) if isinstance(api_key, str) else api_key  # type: ignore[arg-type]
         try:
-            from elevenlabs import ElevenLabs  # Optional dep until library installs
-        except Exception as e:
+            client = _get_client(api_key_ascii)  # Optional dep until library installs
+        except ImportError as e:
             self.parameter_output_values["previews"] = []
             self.parameter_output_values["preview_audios"] = []
             raise ImportError("elevenlabs package not installed. Add 'elevenlabs' to library dependencies.") from e
 
-        # Ensure API key is ASCII-only to avoid header encoding issues in some envs
-        api_key_ascii = _to_ascii(api_key) if isinstance(api_key, str) else api_key  # type: ignore[arg-type]
-        client = ElevenLabs(api_key=api_key_ascii)
-
         # Sanitize strings to ASCII to avoid header encoding issues in some clients/envs
-        def _to_ascii(s: str | None) -> str | None:
-            if s is None:
-                return None
-            try:
-                return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
-            except Exception:
-                return s.encode("ascii", "ignore").decode("ascii")
-
         safe_description = _to_ascii(description) or description
         safe_preview_text = _to_ascii(preview_text) if preview_text is not None else None
 
@@ -385,9 +592,25 @@ class ElevenLabsDesignVoice(DataNode):
         except Exception:
             pass
 
+        # Seeded requests are deterministic and can be answered from the on-disk design cache
+        cache_mode = _design_cache_mode()
+        cache_path = None
+        cached_response = None
+        if seed is not None and cache_mode != "disabled":
+            cache_path = _design_cache_path(str(api_key), {**payload, "output_format": output_format})
+            if cache_mode in ("enabled", "replay"):
+                cached_response = _load_disk_design(cache_path, DESIGN_CACHE_TTL)
+            if cached_response is None and cache_mode == "replay":
+                raise RuntimeError(f"No cached voice design for this request ({DESIGN_CACHE_MODE_ENV_VAR}=replay).")
+
         try:
-            # Some SDKs accept output_format as arg; if not, the client may ignore it gracefully.
-            response = client.text_to_voice.design(output_format=output_format, **payload)
+            if cached_response is not None:
+                self._logger.info("DesignVoice: using cached design response (seed=%s)", seed)
+                response = cached_response
+            else:
+                request_bucket.acquire_blocking(len(safe_description) + len(safe_preview_text or ""))
+                # Some SDKs accept output_format as arg; if not, the client may ignore it gracefully.
+                response = client.text_to_voice.design(output_format=output_format, **payload)
         except TypeError:
             # Fall back if SDK version doesn't accept output_format in method signature
             response = client.text_to_voice.design(**payload)
@@ -406,51 +629,44 @@ class ElevenLabsDesignVoice(DataNode):
                 def _ascii_headers(h: dict[str, Any]) -> dict[str, str]:
                     out: dict[str, str] = {}
                     for k, v in h.items():
-                        ks = _to_ascii(str(k)) or str(k)
-                        vs = _to_ascii(str(v)) or str(v)
+                        ks = _to_ascii_cached(str(k)) or str(k)
+                        vs = _to_ascii_cached(str(v)) or str(v)
                         out[ks] = vs
                     return out
 
                 headers = _ascii_headers(headers)
                 params = {"output_format": output_format}
-                with httpx.Client(timeout=30) as hc:
-                    r = hc.post(url, headers=headers, params=params, json=payload)
+                # content-type is already set in headers; the body is serialized here rather than via json=
+                r = _http_client.post(url, headers=headers, params=params, content=dumps(payload))
                 r.raise_for_status()
-                response = r.json()
+                response = loads(r.content)
                 self._logger.info("Used direct HTTP fallback for design due to header encoding issue: %s", e_hdr)
             except Exception as e_http:
                 raise e_http
 
-        previews = []
-        preview_artifacts = []
-
         # Response shape per docs:
         # {
         #   "previews": [{"audio_base_64": str, "generated_voice_id": str, "media_type": str, "duration_secs": float}],
         #   "text": str
         # }
-        # Normalize response
-        resp_dict: dict[str, Any] = {}
-        try:
-            if isinstance(response, dict):
-                resp_dict = response
-            elif hasattr(response, "model_dump"):
-                resp_dict = response.model_dump()  # type: ignore[attr-defined]
-            elif hasattr(response, "to_dict"):
-                resp_dict = response.to_dict()  # type: ignore[attr-defined]
-            else:
-                # Best-effort: collect public attributes
-                resp_dict = {
-                    k: getattr(response, k)
-                    for k in dir(response)
-                    if not k.startswith("_") and not callable(getattr(response, k))
-                }
-        except Exception:
-            resp_dict = {}
+        # Normalize response: dicts (HTTP fallback, design cache) as-is, SDK models through their instance fields.
+        # Anything else is read through the getattr fallbacks below
+        if isinstance(response, dict):
+            resp_dict: dict[str, Any] = response
+        else:
+            resp_dict = getattr(response, "__dict__", None) or {}
 
         previews_list = resp_dict.get("previews") or getattr(response, "previews", [])  # type: ignore[attr-defined]
         used_text = resp_dict.get("text") or getattr(response, "text", None)  # type: ignore[attr-defined]
 
+        if (
+            previews_list
+            and cache_path is not None
+            and cached_response is None
+            and cache_mode in ("enabled", "write-only")
+        ):
+            _store_disk_design(cache_path, previews_list, used_text)
+
         # Log response summary
         try:
             self._logger.info(
@@ -458,102 +674,28 @@ class ElevenLabsDesignVoice(DataNode):
                 len(previews_list) if isinstance(previews_list, list) else 0,
                 len(used_text) if isinstance(used_text, str) else None,
             )
-            if isinstance(previews_list, list) and previews_list:
+            # dir() on an SDK object is costly, so only enumerate keys when debug logging is on
+            if self._logger.isEnabledFor(logging.DEBUG) and isinstance(previews_list, list) and previews_list:
                 p0 = previews_list[0]
                 keys = list(p0.keys()) if isinstance(p0, dict) else [k for k in dir(p0) if not k.startswith("_")][:10]
                 self._logger.debug("First preview keys: %s", keys)
         except Exception:
             pass
 
-        for i, p in enumerate(previews_list or []):
-            # Support both SDK object and dict
-            audio_b64 = (getattr(p, "audio_base_64", None) if not isinstance(p, dict) else p.get("audio_base_64")) or (
-                getattr(p, "audio_base64", None) if not isinstance(p, dict) else p.get("audio_base64")
-            )
-            gen_id = getattr(p, "generated_voice_id", None) if not isinstance(p, dict) else p.get("generated_voice_id")
-            media_type = (
-                getattr(p, "media_type", None) if not isinstance(p, dict) else p.get("media_type")
-            ) or "audio/mpeg"
-            duration = getattr(p, "duration_secs", None) if not isinstance(p, dict) else p.get("duration_secs")
-
-            # Per-preview logging (truncated)
-            try:
-                self._logger.info(
-                    "Preview[%s]: has_b64=%s b64_len=%s gen_id=%s media_type=%s duration=%s",
-                    i,
-                    bool(audio_b64),
-                    len(audio_b64) if isinstance(audio_b64, str) else None,
-                    gen_id,
-                    media_type,
-                    duration,
-                )
-                if isinstance(audio_b64, str):
-                    self._logger.debug("Preview[%s] b64_head=%s", i, audio_b64[:60])
-            except Exception:
-                pass
-
-            audio_url = None
-            if audio_b64:
-                # Prefer saving to static files for reliable playback
-                mime = media_type if isinstance(media_type, str) else "audio/mpeg"
-                ext = "mp3"
-                if isinstance(mime, str):
-                    if "wav" in mime:
-                        ext = "wav"
-                    elif "ogg" in mime:
-                        ext = "ogg"
-                    elif "mpeg" in mime or "mp3" in mime:
-                        ext = "mp3"
-                try:
-                    audio_bytes = base64.b64decode(audio_b64)
-                    file_stub = gen_id or f"preview_{i + 1}_{uuid4().hex[:8]}"
-                    saved = self._output_file.build_file(default_filename=f"elevenlabs_{file_stub}.{ext}").write_bytes(
-                        audio_bytes
+        # Each preview is decoded and written independently, so the saves run side by side
+        previews_list = list(previews_list or [])
+        results = []
+        if previews_list:
+            with ThreadPoolExecutor(max_workers=len(previews_list)) as pool:
+                count = len(previews_list)
+                results = list(
+                    pool.map(
+                        self._handle_preview, range(count), previews_list, [used_text] * count, [output_format] * count
                     )
-                    audio_artifact = AudioUrlArtifact(value=saved.location)
-                    preview_artifacts.append(audio_artifact)
-                    audio_url = saved.location
-                except Exception as e_save:
-                    # Fallbacks: data URL path
-                    try:
-                        data_url = f"data:{mime};base64,{audio_b64}"
-                        audio_artifact = AudioUrlArtifact(value=data_url)
-                        preview_artifacts.append(audio_artifact)
-                        audio_url = data_url
-                        self._logger.info("Static save failed; used data URL for preview %s: %s", i, e_save)
-                    except Exception as e_art2:
-                        # Last resort: try helper with 'url' key; else leave raw info
-                        try:
-                            from griptape_nodes_library.utils.audio_utils import (
-                                dict_to_audio_url_artifact,  # type: ignore
-                            )
-
-                            data_url = f"data:{mime};base64,{audio_b64}"
-                            audio_dict = {"url": data_url}
-                            audio_artifact = dict_to_audio_url_artifact(audio_dict)
-                            preview_artifacts.append(audio_artifact)
-                            audio_url = data_url
-                        except Exception:
-                            self._logger.info("All conversions failed for preview %s: %s", i, e_art2)
-
-            preview_entry = {
-                "generated_voice_id": gen_id,
-                "media_type": media_type,
-                "duration_secs": duration,
-                "text": used_text,
-                "audio_url": audio_url,
-            }
-            previews.append(preview_entry)
+                )
 
-            # Populate paired outputs: voice_id_N and preview_audio_N
-            id_slot = f"voice_id_{i + 1}"
-            audio_slot = f"preview_audio_{i + 1}"
-            self.parameter_output_values[id_slot] = gen_id
-            try:
-                if i < len(preview_artifacts):
-                    self.publish_update_to_parameter(audio_slot, preview_artifacts[i])
-            except Exception:
-                pass
+        previews = [preview_entry for preview_entry, _ in results]
+        preview_artifacts = [audio_artifact for _, audio_artifact in results if audio_artifact is not None]
 
         # JSON metadata for convenient Display JSON rendering
         self.parameter_output_values["preview_metadata"] = {
@@ -562,10 +704,19 @@ class ElevenLabsDesignVoice(DataNode):
             "previews": previews,
         }
         self.parameter_output_values["preview_audios"] = preview_artifacts
-        # Populate individual outputs if present
+        # Paired outputs voice_id_N and preview_audio_N; slots this run didn't fill are cleared
         for idx in range(3):
-            key = f"preview_audio_{idx + 1}"
-            self.parameter_output_values[key] = preview_artifacts[idx] if idx < len(preview_artifacts) else None
+            preview_entry, audio_artifact = results[idx] if idx < len(results) else (None, None)
+            audio_slot = f"preview_audio_{idx + 1}"
+            self.parameter_output_values[f"voice_id_{idx + 1}"] = (
+                preview_entry["generated_voice_id"] if preview_entry else None
+            )
+            self.parameter_output_values[audio_slot] = audio_artifact
+            try:
+                if audio_artifact is not None:
+                    self.publish_update_to_parameter(audio_slot, audio_artifact)
+            except Exception:
+                pass
         try:
             self._logger.info("Built %s AudioUrlArtifact(s) from %s preview(s)", len(preview_artifacts), len(previews))
         except Exception: